@@ -6,29 +6,40 @@ This script provides an easy way to connect to external MCP servers
 through the MCP Gateway functionality.
 """
 
+import argparse
 import asyncio
 import json
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 # Add the project root to Python path
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from pydantic import BaseModel
+
 from src.ollama_mcp_server.config import get_config
-from src.ollama_mcp_server.tools.registry import ToolRegistry
+from src.ollama_mcp_server.tools.registry import auto_discover_tools, get_tool_registry
 from src.ollama_mcp_server.utils.logging import setup_logging, get_app_logger
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class MCPGatewayManager:
     """Helper class for managing MCP Gateway connections"""
     
     def __init__(self):
         self.config = get_config()
-        setup_logging(self.config)
-        self.logger = get_app_logger(__name__)
-        self.tool_registry = ToolRegistry()
+        self.logger = get_app_logger()
+        self.tool_registry = get_tool_registry()
+        if not self.tool_registry.list_tools("mcp_gateway"):
+            auto_discover_tools(["mcp_gateway"])
     
     async def connect_server(
         self,
@@ -41,13 +52,7 @@ class MCPGatewayManager:
         """Connect to an external MCP server"""
         try:
             # Get the MCP Gateway connect tool
-            tools = await self.tool_registry.get_tools()
-            connect_tool = None
-            
-            for tool in tools:
-                if tool.name == "mcp_gateway_connect":
-                    connect_tool = tool
-                    break
+            connect_tool = self.tool_registry.get_tool("mcp_gateway_connect")
             
             if not connect_tool:
                 self.logger.error("MCP Gateway connect tool not found")
@@ -69,27 +74,35 @@ class MCPGatewayManager:
             # Execute the connection
             result = await connect_tool.execute(args)
             
-            if result.get("success"):
+            if result.success:
                 self.logger.info(f"Successfully connected to server: {server_name}")
                 return True
             else:
-                self.logger.error(f"Failed to connect to server: {result.get('error', 'Unknown error')}")
+                self.logger.error(f"Failed to connect to server: {result.error or 'Unknown error'}")
                 return False
                 
         except Exception as e:
             self.logger.error(f"Error connecting to server {server_name}: {e}")
             return False
     
+    async def connect_many(self, specs: List[Dict]) -> List:
+        """Connect to several MCP servers concurrently
+
+        Args:
+            specs: connect_server keyword arguments, one dict per server
+
+        Returns:
+            One result per spec, either a bool or the raised exception
+        """
+        return await asyncio.gather(
+            *(self.connect_server(**spec) for spec in specs),
+            return_exceptions=True
+        )
+
     async def list_servers(self) -> Dict:
         """List all connected servers"""
         try:
-            tools = await self.tool_registry.get_tools()
-            list_tool = None
-            
-            for tool in tools:
-                if tool.name == "mcp_gateway_list_servers":
-                    list_tool = tool
-                    break
+            list_tool = self.tool_registry.get_tool("mcp_gateway_list_servers")
             
             if not list_tool:
                 return {"error": "MCP Gateway list servers tool not found"}
@@ -103,13 +116,7 @@ class MCPGatewayManager:
     async def list_tools(self, server_name: Optional[str] = None) -> Dict:
         """List tools from connected servers"""
         try:
-            tools = await self.tool_registry.get_tools()
-            list_tools_tool = None
-            
-            for tool in tools:
-                if tool.name == "mcp_gateway_list_tools":
-                    list_tools_tool = tool
-                    break
+            list_tools_tool = self.tool_registry.get_tool("mcp_gateway_list_tools")
             
             if not list_tools_tool:
                 return {"error": "MCP Gateway list tools tool not found"}
@@ -125,86 +132,162 @@ class MCPGatewayManager:
             return {"error": f"Error listing tools: {e}"}
 
 
-async def main():
-    """Main CLI interface"""
-    if len(sys.argv) < 2:
-        print("Usage:")
-        print("  python scripts/mcp-gateway-connect.py connect <server_name> <transport_type> [options]")
-        print("  python scripts/mcp-gateway-connect.py list-servers")
-        print("  python scripts/mcp-gateway-connect.py list-tools [server_name]")
-        print("")
-        print("Examples:")
-        print("  # Connect to Node.js MCP server via stdio")
-        print("  python scripts/mcp-gateway-connect.py connect ollama_node stdio --command 'node,server.js'")
-        print("")
-        print("  # Connect to remote MCP server via SSE")
-        print("  python scripts/mcp-gateway-connect.py connect remote_server sse --url 'https://example.com/mcp'")
-        print("")
-        print("  # List connected servers")
-        print("  python scripts/mcp-gateway-connect.py list-servers")
-        print("")
-        print("  # List all tools")
-        print("  python scripts/mcp-gateway-connect.py list-tools")
-        return
-    
-    command = sys.argv[1]
-    gateway = MCPGatewayManager()
-    
-    if command == "connect":
-        if len(sys.argv) < 4:
-            print("Error: connect requires server_name and transport_type")
-            return
-        
-        server_name = sys.argv[2]
-        transport_type = sys.argv[3]
-        
-        # Parse additional options
-        stdio_command = None
-        sse_url = None
-        environment = {}
-        
-        i = 4
-        while i < len(sys.argv):
-            if sys.argv[i] == "--command" and i + 1 < len(sys.argv):
-                stdio_command = sys.argv[i + 1].split(",")
-                i += 2
-            elif sys.argv[i] == "--url" and i + 1 < len(sys.argv):
-                sse_url = sys.argv[i + 1]
-                i += 2
-            elif sys.argv[i] == "--env" and i + 1 < len(sys.argv):
-                env_pairs = sys.argv[i + 1].split(",")
-                for pair in env_pairs:
-                    key, value = pair.split("=", 1)
-                    environment[key] = value
-                i += 2
-            else:
-                i += 1
-        
-        success = await gateway.connect_server(
-            server_name=server_name,
-            transport_type=transport_type,
-            stdio_command=stdio_command,
-            sse_url=sse_url,
-            environment=environment
+def print_json(result) -> None:
+    """Write a command result to stdout as indented JSON without an interim string"""
+    if isinstance(result, BaseModel):
+        result = result.model_dump(mode="json")
+
+    if ORJSON_AVAILABLE:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(
+            orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
         )
-        
-        if success:
+        sys.stdout.buffer.flush()
+    else:
+        json.dump(result, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+
+def parse_env_pairs(value: str) -> List[Tuple[str, str]]:
+    """Split a comma-separated list of KEY=VALUE pairs"""
+    pairs = []
+    for pair in value.split(","):
+        key, sep, item = pair.partition("=")
+        if not sep or not key:
+            raise argparse.ArgumentTypeError(f"expected KEY=VALUE, got {pair!r}")
+        pairs.append((key, item))
+    return pairs
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser"""
+    parser = argparse.ArgumentParser(
+        prog="mcp-gateway-connect.py",
+        description="Connect to external MCP servers through the MCP Gateway",
+        epilog="""Examples:
+  # Connect to Node.js MCP server via stdio
+  python scripts/mcp-gateway-connect.py connect ollama_node stdio --command 'node,server.js'
+
+  # Connect to remote MCP server via SSE
+  python scripts/mcp-gateway-connect.py connect remote_server sse --url 'https://example.com/mcp'
+
+  # Connect to several servers at once (one JSON spec per line)
+  python scripts/mcp-gateway-connect.py connect --batch servers.jsonl
+
+  # List connected servers
+  python scripts/mcp-gateway-connect.py list-servers
+
+  # List all tools
+  python scripts/mcp-gateway-connect.py list-tools""",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    connect_parser = subparsers.add_parser("connect", help="Connect to an MCP server")
+    connect_parser.add_argument("server_name", nargs="?")
+    connect_parser.add_argument("transport_type", nargs="?")
+    connect_parser.add_argument(
+        "--command",
+        dest="stdio_command",
+        type=lambda value: value.split(","),
+        help="Comma-separated stdio command",
+    )
+    connect_parser.add_argument("--url", dest="sse_url", help="SSE endpoint URL")
+    connect_parser.add_argument(
+        "--env",
+        action="append",
+        type=parse_env_pairs,
+        default=[],
+        help="KEY=VALUE pairs, comma-separated or repeated",
+    )
+    connect_parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="JSON lines file with one connect spec per line, connected concurrently",
+    )
+
+    subparsers.add_parser("list-servers", help="List connected servers")
+
+    list_tools_parser = subparsers.add_parser("list-tools", help="List available tools")
+    list_tools_parser.add_argument("server_name", nargs="?")
+
+    return parser
+
+
+async def do_connect_batch(gateway: MCPGatewayManager, path: str) -> None:
+    """Connect to every server listed in a JSON lines file"""
+    with open(path, encoding="utf-8") as f:
+        specs = [json.loads(line) for line in f if line.strip()]
+
+    results = await gateway.connect_many(specs)
+
+    for spec, success in zip(specs, results):
+        server_name = spec.get("server_name")
+        if success is True:
             print(f"✅ Successfully connected to {server_name}")
+        elif isinstance(success, BaseException):
+            print(f"❌ Failed to connect to {server_name}: {type(success).__name__}: {success}")
         else:
             print(f"❌ Failed to connect to {server_name}")
-    
-    elif command == "list-servers":
-        result = await gateway.list_servers()
-        print(json.dumps(result, indent=2))
-    
-    elif command == "list-tools":
-        server_name = sys.argv[2] if len(sys.argv) > 2 else None
-        result = await gateway.list_tools(server_name)
-        print(json.dumps(result, indent=2))
-    
+
+
+async def do_connect(gateway: MCPGatewayManager, args: argparse.Namespace) -> None:
+    """Handle the connect command"""
+    if args.batch:
+        await do_connect_batch(gateway, args.batch)
+        return
+
+    environment = {key: value for pairs in args.env for key, value in pairs}
+
+    success = await gateway.connect_server(
+        server_name=args.server_name,
+        transport_type=args.transport_type,
+        stdio_command=args.stdio_command,
+        sse_url=args.sse_url,
+        environment=environment
+    )
+
+    if success:
+        print(f"✅ Successfully connected to {args.server_name}")
     else:
-        print(f"Unknown command: {command}")
+        print(f"❌ Failed to connect to {args.server_name}")
+
+
+async def do_list_servers(gateway: MCPGatewayManager, args: argparse.Namespace) -> None:
+    """Handle the list-servers command"""
+    result = await gateway.list_servers()
+    print_json(result)
+
+
+async def do_list_tools(gateway: MCPGatewayManager, args: argparse.Namespace) -> None:
+    """Handle the list-tools command"""
+    result = await gateway.list_tools(args.server_name)
+    print_json(result)
+
+
+COMMANDS = {
+    "connect": do_connect,
+    "list-servers": do_list_servers,
+    "list-tools": do_list_tools,
+}
+
+
+async def main():
+    """Main CLI interface"""
+    parser = build_parser()
+    args = parser.parse_args()
+
+    if args.command is None:
+        parser.print_help()
+        return
+
+    if args.command == "connect" and not args.batch and not args.transport_type:
+        parser.error("connect requires server_name and transport_type, or --batch")
+
+    setup_logging()
+    gateway = MCPGatewayManager()
+    await COMMANDS[args.command](gateway, args)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
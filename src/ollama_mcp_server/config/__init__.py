@@ -1,17 +1,20 @@
 """Configuration package for MCP DevOps Server"""
 
-from .settings import (
-    DevOpsConfig,
-    OllamaConfig,
-    OllamaAgentConfig,
-    SecurityConfig,
-    ToolConfig,
-    InfrastructureConfig,
-    MonitoringConfig,
-    get_config,
-    set_config,
-    reload_config,
-)
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .settings import (
+        DevOpsConfig,
+        OllamaConfig,
+        OllamaAgentConfig,
+        SecurityConfig,
+        ToolConfig,
+        InfrastructureConfig,
+        MonitoringConfig,
+        get_config,
+        set_config,
+        reload_config,
+    )
 
 __all__ = [
     "DevOpsConfig",
@@ -25,3 +28,14 @@ __all__ = [
     "set_config",
     "reload_config",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the settings module lazily on first access to a public name"""
+    if name in __all__:
+        from . import settings
+
+        value = getattr(settings, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,13 +5,41 @@ This module provides comprehensive configuration management with environment
 variable support, validation, and type safety using Pydantic.
 """
 
+import functools
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+)
 
 try:
-    from pydantic import BaseModel, Field, field_validator
+    from pydantic import (
+        BaseModel,
+        ConfigDict,
+        Field,
+        PrivateAttr,
+        TypeAdapter,
+        field_validator,
+        model_validator,
+    )
 except ImportError:
-    from pydantic import BaseModel, Field
+    from pydantic import BaseModel, Field, PrivateAttr
+
+    ConfigDict = dict
 
     # For older Pydantic versions
     def field_validator(*args, **kwargs):
@@ -20,57 +48,150 @@ except ImportError:
 
         return decorator
 
+    model_validator = field_validator
+
 
 try:
-    from pydantic_settings import BaseSettings
+    from pydantic_settings import BaseSettings, SettingsConfigDict
 except ImportError:
     # Fallback to older import
     from pydantic import BaseSettings
 
+    SettingsConfigDict = dict
+
 import yaml
+from typing_extensions import TypedDict
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    # libyaml bindings not available, use the pure-Python loader
+    from yaml import SafeLoader as _YamlLoader
+
+# Settings shared by every configuration class, which each add an env prefix
+_BASE_SETTINGS_CONFIG = SettingsConfigDict(case_sensitive=False)
+
+# Accepted values for validated string fields. Pydantic returns the matching
+# literal itself, so validated values are always the interned constants below.
+LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+TransportType = Literal["stdio", "http"]
+Environment = Literal["development", "staging", "production"]
+AgentRole = Literal[
+    "primary",
+    "secondary",
+    "tertiary",
+    "quaternary",
+    "quinary",
+    "senary",
+    "septenary",
+    "octonary",
+    "analyst",
+    "reviewer",
+    "validator",
+    "executor",
+    "monitor",
+    "coordinator",
+    "specialist",
+    "assistant",
+]
+
+
+def _lower(v: Any) -> Any:
+    """Lowercase string input ahead of case-sensitive literal validation"""
+    return v.lower() if isinstance(v, str) else v
+
+
+def _upper(v: Any) -> Any:
+    """Uppercase string input ahead of case-sensitive literal validation"""
+    return v.upper() if isinstance(v, str) else v
+
+
+# Additional agents are configured through OLLAMA_AGENT_<N>_<URL|KEY|MODEL|ROLE>
+# for N in 2..8, each number defaulting to its own role
+_AGENT_ENV_RE = re.compile(
+    r"OLLAMA_AGENT_(?P<num>\d+)_(?P<setting>URL|KEY|MODEL|ROLE)", re.IGNORECASE
+)
+_AGENT_DEFAULT_ROLES = {
+    2: "secondary",
+    3: "tertiary",
+    4: "quaternary",
+    5: "quinary",
+    6: "senary",
+    7: "septenary",
+    8: "octonary",
+}
+
+
+# The same agent settings given as OllamaConfig input, e.g. from YAML
+_AGENT_FIELD_RE = re.compile(
+    r"agent_(?P<num>\d+)_(?P<setting>url|key|model|role)", re.IGNORECASE
+)
+
+
+def _agent_items(
+    names: Iterable[Tuple[str, Any]], pattern: "re.Pattern[str]"
+) -> Tuple[Tuple[int, str, Any], ...]:
+    """Collect (agent number, setting, value) for every name matching pattern"""
+    items = []
+    for name, value in names:
+        match = pattern.fullmatch(name)
+        if match is not None:
+            num = int(match["num"])
+            if num in _AGENT_DEFAULT_ROLES:
+                items.append((num, match["setting"].lower(), value))
+    return tuple(sorted(items, key=lambda item: item[:2]))
+
+
+def _agent_env_items(environ: Mapping[str, str]) -> Tuple[Tuple[int, str, str], ...]:
+    """Collect (agent number, setting, value) for every agent env variable"""
+    return _agent_items(environ.items(), _AGENT_ENV_RE)
+
+
+def _agent_specs(
+    items: Iterable[Tuple[int, str, Any]],
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """Group agent settings into per-agent settings, ordered by number"""
+    specs: Dict[int, Dict[str, Any]] = {}
+    for num, setting, value in items:
+        specs.setdefault(num, {})[setting] = value
+    return sorted(specs.items())
+
+
+def _agent_env_specs(environ: Mapping[str, str]) -> List[Tuple[int, Dict[str, str]]]:
+    """Group agent env variables into per-agent settings, ordered by number"""
+    return _agent_specs(_agent_env_items(environ))
 
 
 class OllamaAgentConfig(BaseModel):
     """Configuration for individual Ollama agent/role"""
 
+    model_config = ConfigDict(frozen=True)
+
     api_url: str = Field(description="Ollama API endpoint URL for this agent")
     api_key: Optional[str] = Field(
         default=None, description="API key for this endpoint"
     )
     model: str = Field(description="Model to use for this agent")
-    role: str = Field(description="Role/purpose of this agent")
+    role: AgentRole = Field(description="Role/purpose of this agent")
     timeout: int = Field(default=30, description="Request timeout in seconds")
     max_retries: int = Field(default=3, description="Maximum retry attempts")
 
-    @field_validator("role")
+    @field_validator("api_url")
     @classmethod
-    def validate_role(cls, v):
-        valid_roles = [
-            "primary",
-            "secondary",
-            "tertiary",
-            "quaternary",
-            "quinary",
-            "senary",
-            "septenary",
-            "octonary",
-            "analyst",
-            "reviewer",
-            "validator",
-            "executor",
-            "monitor",
-            "coordinator",
-            "specialist",
-            "assistant",
-        ]
-        if v.lower() not in valid_roles:
-            raise ValueError(f'role must be one of: {", ".join(valid_roles)}')
-        return v.lower()
+    def normalize_api_url(cls, v):
+        return v.rstrip("/")
+
+    @field_validator("role", mode="before")
+    @classmethod
+    def normalize_role(cls, v):
+        return _lower(v)
 
 
 class OllamaConfig(BaseSettings):
     """MCP Ollama Server configuration with multi-agent support"""
 
+    model_config = _BASE_SETTINGS_CONFIG | SettingsConfigDict(env_prefix="OLLAMA_")
+
     # Primary endpoint (backward compatibility)
     api_url: str = Field(
         default="http://localhost:11434", description="Primary Ollama API endpoint URL"
@@ -87,52 +208,58 @@ class OllamaConfig(BaseSettings):
         default_factory=dict,
         description="Configuration for multiple Ollama agents/endpoints",
     )
+    _role_index: Dict[str, OllamaAgentConfig] = PrivateAttr(default_factory=dict)
 
-    # Auto-configure standard agents from environment
-    agent_2_url: Optional[str] = Field(default=None, description="Second agent API URL")
-    agent_2_key: Optional[str] = Field(default=None, description="Second agent API key")
-    agent_2_model: str = Field(default="llama2", description="Second agent model")
-    agent_2_role: str = Field(default="secondary", description="Second agent role")
-
-    agent_3_url: Optional[str] = Field(default=None, description="Third agent API URL")
-    agent_3_key: Optional[str] = Field(default=None, description="Third agent API key")
-    agent_3_model: str = Field(default="llama2", description="Third agent model")
-    agent_3_role: str = Field(default="tertiary", description="Third agent role")
-
-    agent_4_url: Optional[str] = Field(default=None, description="Fourth agent API URL")
-    agent_4_key: Optional[str] = Field(default=None, description="Fourth agent API key")
-    agent_4_model: str = Field(default="llama2", description="Fourth agent model")
-    agent_4_role: str = Field(default="quaternary", description="Fourth agent role")
-
-    agent_5_url: Optional[str] = Field(default=None, description="Fifth agent API URL")
-    agent_5_key: Optional[str] = Field(default=None, description="Fifth agent API key")
-    agent_5_model: str = Field(default="llama2", description="Fifth agent model")
-    agent_5_role: str = Field(default="quinary", description="Fifth agent role")
-
-    agent_6_url: Optional[str] = Field(default=None, description="Sixth agent API URL")
-    agent_6_key: Optional[str] = Field(default=None, description="Sixth agent API key")
-    agent_6_model: str = Field(default="llama2", description="Sixth agent model")
-    agent_6_role: str = Field(default="senary", description="Sixth agent role")
-
-    agent_7_url: Optional[str] = Field(
-        default=None, description="Seventh agent API URL"
-    )
-    agent_7_key: Optional[str] = Field(
-        default=None, description="Seventh agent API key"
-    )
-    agent_7_model: str = Field(default="llama2", description="Seventh agent model")
-    agent_7_role: str = Field(default="septenary", description="Seventh agent role")
+    @field_validator("api_url")
+    @classmethod
+    def normalize_api_url(cls, v):
+        return v.rstrip("/")
 
-    agent_8_url: Optional[str] = Field(default=None, description="Eighth agent API URL")
-    agent_8_key: Optional[str] = Field(default=None, description="Eighth agent API key")
-    agent_8_model: str = Field(default="llama2", description="Eighth agent model")
-    agent_8_role: str = Field(default="octonary", description="Eighth agent role")
+    @model_validator(mode="before")
+    @classmethod
+    def collect_agent_settings(cls, data: Any) -> Any:
+        """Turn agent_<N>_<url|key|model|role> input keys into agents"""
+        if not isinstance(data, dict):
+            return data
+
+        items = _agent_items(data.items(), _AGENT_FIELD_RE)
+        if not items:
+            return data
+
+        data = {
+            name: value
+            for name, value in data.items()
+            if not _agent_items([(name, value)], _AGENT_FIELD_RE)
+        }
+        agents = dict(data.get("agents") or {})
+
+        for num, spec in _agent_specs(items):
+            key = f"agent_{num}"
+            url = spec.get("url")
+            if url and key not in agents:
+                agents[key] = {
+                    "api_url": url,
+                    "api_key": spec.get("key"),
+                    "model": spec.get("model", "llama2"),
+                    "role": spec.get("role", _AGENT_DEFAULT_ROLES[num]),
+                    "timeout": data.get("timeout", cls.model_fields["timeout"].default),
+                    "max_retries": data.get(
+                        "max_retries", cls.model_fields["max_retries"].default
+                    ),
+                }
+        data["agents"] = agents
+        return data
 
     def model_post_init(self, __context) -> None:
         """Auto-configure agents from environment variables"""
+        # Agent fields come from this already-validated model, so agents are
+        # built with model_construct and only the role is checked explicitly
+
+        agents = self.agents
+
         # Add primary agent
-        if not self.agents.get("primary"):
-            self.agents["primary"] = OllamaAgentConfig(
+        if "primary" not in agents:
+            agents["primary"] = OllamaAgentConfig.model_construct(
                 api_url=self.api_url,
                 api_key=self.api_key,
                 model=self.default_model,
@@ -142,92 +269,52 @@ class OllamaConfig(BaseSettings):
             )
 
         # Auto-configure additional agents from environment
-        agent_configs = [
-            (
-                2,
-                self.agent_2_url,
-                self.agent_2_key,
-                self.agent_2_model,
-                self.agent_2_role,
-            ),
-            (
-                3,
-                self.agent_3_url,
-                self.agent_3_key,
-                self.agent_3_model,
-                self.agent_3_role,
-            ),
-            (
-                4,
-                self.agent_4_url,
-                self.agent_4_key,
-                self.agent_4_model,
-                self.agent_4_role,
-            ),
-            (
-                5,
-                self.agent_5_url,
-                self.agent_5_key,
-                self.agent_5_model,
-                self.agent_5_role,
-            ),
-            (
-                6,
-                self.agent_6_url,
-                self.agent_6_key,
-                self.agent_6_model,
-                self.agent_6_role,
-            ),
-            (
-                7,
-                self.agent_7_url,
-                self.agent_7_key,
-                self.agent_7_model,
-                self.agent_7_role,
-            ),
-            (
-                8,
-                self.agent_8_url,
-                self.agent_8_key,
-                self.agent_8_model,
-                self.agent_8_role,
-            ),
-        ]
-
-        for num, url, key, model, role in agent_configs:
-            if url and not self.agents.get(f"agent_{num}"):
-                self.agents[f"agent_{num}"] = OllamaAgentConfig(
-                    api_url=url,
-                    api_key=key,
-                    model=model,
-                    role=role,
+        for num, spec in _agent_env_specs(os.environ):
+            key = f"agent_{num}"
+            url = spec.get("url")
+            if url and key not in agents:
+                agents[key] = OllamaAgentConfig.model_construct(
+                    api_url=url.rstrip("/"),
+                    api_key=spec.get("key"),
+                    model=spec.get("model", "llama2"),
+                    role=_type_adapter(AgentRole).validate_python(
+                        spec.get("role", _AGENT_DEFAULT_ROLES[num]).lower()
+                    ),
                     timeout=self.timeout,
                     max_retries=self.max_retries,
                 )
 
+        # Index agents by role once; the first agent configured for a role wins
+        role_index: Dict[str, OllamaAgentConfig] = {}
+        for agent in agents.values():
+            role_index.setdefault(agent.role, agent)
+        self._role_index = role_index
+
     def get_agent_by_role(self, role: str) -> Optional[OllamaAgentConfig]:
         """Get agent configuration by role"""
-        for agent in self.agents.values():
-            if agent.role == role.lower():
-                return agent
-        return None
+        return self._role_index.get(role.lower())
 
     def get_available_agents(self) -> List[str]:
         """Get list of available agent names"""
         return list(self.agents.keys())
 
-    def get_agents_by_role(self) -> Dict[str, OllamaAgentConfig]:
-        """Get agents organized by role"""
-        return {agent.role: agent for agent in self.agents.values()}
+    @property
+    def agents_by_role(self) -> Dict[str, OllamaAgentConfig]:
+        """Agents organized by role (shared mapping, do not modify)"""
+        return self._role_index
 
-    class Config:
-        env_prefix = "OLLAMA_"
-        case_sensitive = False
+    def get_agents_by_role(self) -> Dict[str, OllamaAgentConfig]:
+        """Get agents organized by role (shared mapping, do not modify)"""
+        return self.agents_by_role
 
 
 class SecurityConfig(BaseSettings):
     """Security and authentication configuration"""
 
+    model_config = _BASE_SETTINGS_CONFIG | SettingsConfigDict(
+        env_prefix="SECURITY_", frozen=True
+    )
+
     api_key_management: bool = Field(
         default=True, description="Enable API key management"
     )
@@ -244,14 +331,12 @@ class SecurityConfig(BaseSettings):
         default=1048576, description="Maximum input size in bytes"  # 1MB
     )
 
-    class Config:
-        env_prefix = "SECURITY_"
-        case_sensitive = False
-
 
 class ToolConfig(BaseSettings):
     """Tool execution configuration"""
 
+    model_config = _BASE_SETTINGS_CONFIG | SettingsConfigDict(env_prefix="TOOL_")
+
     execution_timeout: int = Field(
         default=300,  # 5 minutes
         description="Default tool execution timeout in seconds",
@@ -263,15 +348,31 @@ class ToolConfig(BaseSettings):
         default=True, description="Enable result caching for expensive operations"
     )
     cache_ttl: int = Field(default=3600, description="Cache TTL in seconds")  # 1 hour
-
-    class Config:
-        env_prefix = "TOOL_"
-        case_sensitive = False
+    cache_max_entries: int = Field(
+        default=1024, description="Maximum number of cached results per tool"
+    )
+    pretty_json: bool = Field(
+        default=False, description="Indent JSON tool results returned to clients"
+    )
+    max_result_chars: int = Field(
+        default=1048576,  # 1M characters
+        description="Maximum length of a formatted tool result, longer ones are truncated",
+    )
+    health_check_timeout: float = Field(
+        default=5.0, description="Per-tool health check timeout in seconds"
+    )
+    max_concurrent_health_checks: int = Field(
+        default=10, description="Maximum number of concurrent tool health checks"
+    )
 
 
 class InfrastructureConfig(BaseSettings):
     """Infrastructure tool configuration"""
 
+    model_config = _BASE_SETTINGS_CONFIG | SettingsConfigDict(
+        env_prefix="INFRA_", frozen=True
+    )
+
     docker_enabled: bool = Field(default=True, description="Enable Docker tools")
     kubernetes_enabled: bool = Field(
         default=True, description="Enable Kubernetes tools"
@@ -291,14 +392,14 @@ class InfrastructureConfig(BaseSettings):
         default="default", description="Default Kubernetes namespace"
     )
 
-    class Config:
-        env_prefix = "INFRA_"
-        case_sensitive = False
-
 
 class MonitoringConfig(BaseSettings):
     """Monitoring and observability configuration"""
 
+    model_config = _BASE_SETTINGS_CONFIG | SettingsConfigDict(
+        env_prefix="MONITORING_", frozen=True
+    )
+
     prometheus_enabled: bool = Field(
         default=True, description="Enable Prometheus tools"
     )
@@ -321,88 +422,233 @@ class MonitoringConfig(BaseSettings):
         default=60, description="Health check interval in seconds"
     )
 
-    class Config:
-        env_prefix = "MONITORING_"
-        case_sensitive = False
+
+def _env_var_names(config_cls: type) -> FrozenSet[str]:
+    """
+    List the environment variable names a settings class can read
+
+    Names are derived once from the env prefix and field names, upper-cased
+    since settings are case-insensitive.
+    """
+    prefix = config_cls.model_config.get("env_prefix", "")
+    return frozenset(
+        f"{prefix}{field_name}".upper() for field_name in config_cls.model_fields
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _build_sub_config(config_cls: type, env_values: Tuple[Any, ...]) -> BaseSettings:
+    """Build a sub-configuration once per distinct set of its env values"""
+    return config_cls()
+
+
+def _cached_sub_config(
+    config_cls: type,
+    extra_env: Optional[Callable[[Mapping[str, str]], Tuple]] = None,
+):
+    """
+    Create a default factory that reuses sub-configurations across instances
+
+    The cache is keyed on the environment variables the class reads, matched
+    case-insensitively, so changing the environment still yields a fresh
+    instance.
+    Classes that also read variables not derived from their fields pass
+    extra_env to add those to the key. Frozen configurations are shared
+    as-is; mutable ones are copied per call.
+    """
+    env_names = _env_var_names(config_cls)
+    frozen = config_cls.model_config.get("frozen", False)
+
+    def factory() -> BaseSettings:
+        environ = os.environ
+        env_values = tuple(
+            sorted(
+                (name.upper(), value)
+                for name, value in environ.items()
+                if name.upper() in env_names
+            )
+        )
+        if extra_env is not None:
+            env_values += (extra_env(environ),)
+        config = _build_sub_config(config_cls, env_values)
+        return config if frozen else config.model_copy(deep=True)
+
+    return factory
+
+
+class _JsonCache(TypedDict):
+    """Layout of the JSON cache of a parsed YAML configuration file"""
+
+    mtime_ns: int
+    size: int
+    data: Any
+
+
+@functools.lru_cache(maxsize=None)
+def _type_adapter(tp: Any) -> "TypeAdapter":
+    """Build a TypeAdapter once per type and reuse its compiled validator"""
+    return TypeAdapter(tp)
+
+
+def _json_cache_path(config_path: Path) -> Path:
+    """Path of the JSON cache for a YAML file, under the user cache directory"""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    digest = hashlib.blake2b(
+        os.fsencode(config_path.resolve()), digest_size=16
+    ).hexdigest()
+    return Path(cache_home, "ollama-mcp-server", "config", f"{digest}.json")
+
+
+def _read_json_cache(config_path: Path, st: os.stat_result) -> Optional[Any]:
+    """
+    Read parsed YAML data from its JSON cache
+
+    Returns:
+        The cached data, or None if the cache is missing, unreadable or was
+        written for a different version of the YAML file
+    """
+    try:
+        with open(_json_cache_path(config_path), "rb") as f:
+            cached = _type_adapter(_JsonCache).validate_json(f.read())
+        if cached["mtime_ns"] == st.st_mtime_ns and cached["size"] == st.st_size:
+            return cached["data"]
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _write_json_cache(config_path: Path, st: os.stat_result, data: Any) -> None:
+    """Atomically cache parsed YAML data as JSON, ignoring any failure"""
+    try:
+        payload = json.dumps(
+            {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "data": data}
+        )
+        # JSON turns non-string mapping keys into strings; such files are
+        # always parsed from YAML so the configuration sees the same types
+        if json.loads(payload)["data"] != data:
+            return
+
+        cache_path = _json_cache_path(config_path)
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError):
+        # Unwritable cache directories or values JSON cannot represent (e.g.
+        # YAML dates) simply leave the YAML file as the only source
+        pass
 
 
 class DevOpsConfig(BaseSettings):
     """Main configuration class for MCP DevOps Server"""
 
+    model_config = _BASE_SETTINGS_CONFIG | SettingsConfigDict(
+        env_prefix="MCP_DEVOPS_", env_nested_delimiter="__"
+    )
+
     # Server configuration
     server_name: str = Field(default="mcp-devops-server", description="Server name")
     server_version: str = Field(default="2.0.0", description="Server version")
     debug: bool = Field(default=False, description="Enable debug logging")
-    log_level: str = Field(default="INFO", description="Logging level")
+    log_level: LogLevel = Field(default="INFO", description="Logging level")
 
     # Transport configuration
-    transport_type: str = Field(
+    transport_type: TransportType = Field(
         default="stdio", description="Transport type: stdio or http"
     )
     http_host: str = Field(default="0.0.0.0", description="HTTP server host")
     http_port: int = Field(default=8000, description="HTTP server port")
 
     # Environment
-    environment: str = Field(
+    environment: Environment = Field(
         default="development",
         description="Environment: development, staging, production",
     )
 
     # Sub-configurations
-    ollama: OllamaConfig = Field(default_factory=OllamaConfig)
-    security: SecurityConfig = Field(default_factory=SecurityConfig)
-    tools: ToolConfig = Field(default_factory=ToolConfig)
-    infrastructure: InfrastructureConfig = Field(default_factory=InfrastructureConfig)
-    monitoring: MonitoringConfig = Field(default_factory=MonitoringConfig)
-
-    @field_validator("log_level")
-    @classmethod
-    def validate_log_level(cls, v):
-        valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in valid_levels:
-            raise ValueError(f'log_level must be one of: {", ".join(valid_levels)}')
-        return v.upper()
+    ollama: OllamaConfig = Field(
+        default_factory=_cached_sub_config(OllamaConfig, _agent_env_items)
+    )
+    security: SecurityConfig = Field(default_factory=_cached_sub_config(SecurityConfig))
+    tools: ToolConfig = Field(default_factory=_cached_sub_config(ToolConfig))
+    infrastructure: InfrastructureConfig = Field(
+        default_factory=_cached_sub_config(InfrastructureConfig)
+    )
+    monitoring: MonitoringConfig = Field(
+        default_factory=_cached_sub_config(MonitoringConfig)
+    )
 
-    @field_validator("transport_type")
+    @field_validator("log_level", mode="before")
     @classmethod
-    def validate_transport_type(cls, v):
-        valid_types = ["stdio", "http"]
-        if v.lower() not in valid_types:
-            raise ValueError(f'transport_type must be one of: {", ".join(valid_types)}')
-        return v.lower()
+    def normalize_log_level(cls, v):
+        return _upper(v)
 
-    @field_validator("environment")
+    @field_validator("transport_type", "environment", mode="before")
     @classmethod
-    def validate_environment(cls, v):
-        valid_envs = ["development", "staging", "production"]
-        if v.lower() not in valid_envs:
-            raise ValueError(f'environment must be one of: {", ".join(valid_envs)}')
-        return v.lower()
-
-    class Config:
-        env_prefix = "MCP_DEVOPS_"
-        case_sensitive = False
-        env_nested_delimiter = "__"
+    def normalize_choice(cls, v):
+        return _lower(v)
 
     @classmethod
     def from_yaml(cls, config_path: Path) -> "DevOpsConfig":
-        """Load configuration from YAML file"""
+        """
+        Load configuration from YAML file
+
+        Parsed and validated configurations are cached by class, path, mtime,
+        size and the configuration environment variables, so reloading an
+        unchanged file skips both YAML parsing and validation.
+        Each call returns its own copy, as callers may apply overrides. Across
+        processes, the parsed data is reused from a JSON file in the user cache
+        directory.
+        """
         if not config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-        with open(config_path, "r") as f:
-            config_data = yaml.safe_load(f)
-
-        return cls(**config_data)
+        st = config_path.stat()
+        key = (
+            cls,
+            str(config_path),
+            st.st_mtime_ns,
+            st.st_size,
+            _config_env_items(os.environ),
+        )
+
+        with _YAML_CACHE_LOCK:
+            cached = _YAML_CACHE.get(key)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+
+        config_data = _read_json_cache(config_path, st)
+        if config_data is None:
+            with open(config_path, "rb") as f:
+                config_data = yaml.load(f, Loader=_YamlLoader)
+            _write_json_cache(config_path, st, config_data)
+
+        config = cls(**config_data)
+        with _YAML_CACHE_LOCK:
+            _YAML_CACHE[key] = config
+        return config.model_copy(deep=True)
 
     @classmethod
     def from_env(cls) -> "DevOpsConfig":
-        """Load configuration from environment variables"""
+        """
+        Load configuration from environment variables
+
+        When no variable carries one of the configuration prefixes, the result
+        is a copy of a default instance built once, skipping the settings
+        sources entirely.
+        """
+        if not _has_config_env(os.environ):
+            return _default_config(cls).model_copy(deep=True)
         return cls()
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert configuration to dictionary"""
-        return self.dict()
+        """Convert configuration to a dictionary of JSON-compatible values"""
+        return self.model_dump(mode="json")
 
     def is_production(self) -> bool:
         """Check if running in production environment"""
@@ -413,26 +659,77 @@ class DevOpsConfig(BaseSettings):
         return self.environment == "development"
 
 
+# Env prefixes read by any configuration class, upper-cased for matching
+_CONFIG_ENV_PREFIXES = tuple(
+    config_cls.model_config["env_prefix"].upper()
+    for config_cls in (
+        DevOpsConfig,
+        OllamaConfig,
+        SecurityConfig,
+        ToolConfig,
+        InfrastructureConfig,
+        MonitoringConfig,
+    )
+)
+
+
+def _has_config_env(environ: Mapping[str, str]) -> bool:
+    """Check whether any environment variable could override a setting"""
+    return any(name.upper().startswith(_CONFIG_ENV_PREFIXES) for name in environ)
+
+
+def _config_env_items(environ: Mapping[str, str]) -> Tuple[Tuple[str, str], ...]:
+    """Environment variables that could override a setting, in a stable order"""
+    return tuple(
+        sorted(
+            (name, value)
+            for name, value in environ.items()
+            if name.upper().startswith(_CONFIG_ENV_PREFIXES)
+        )
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _default_config(config_cls: type) -> DevOpsConfig:
+    """Build the configuration once for an environment without overrides"""
+    return config_cls()
+
+
+# Cache of configurations loaded from YAML, keyed by
+# (class, path, mtime_ns, size, configuration environment variables)
+_YAML_CACHE: Dict[Tuple[Any, ...], DevOpsConfig] = {}
+_YAML_CACHE_LOCK = threading.Lock()
+
 # Global configuration instance
 _config: Optional[DevOpsConfig] = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> DevOpsConfig:
     """Get the global configuration instance"""
     global _config
-    if _config is None:
-        _config = DevOpsConfig.from_env()
-    return _config
+    config = _config
+    if config is not None:
+        return config
+
+    with _config_lock:
+        if _config is None:
+            _config = DevOpsConfig.from_env()
+        return _config
 
 
 def set_config(config: DevOpsConfig) -> None:
     """Set the global configuration instance"""
     global _config
-    _config = config
+    with _config_lock:
+        _config = config
 
 
 def reload_config() -> DevOpsConfig:
     """Reload configuration from environment"""
     global _config
-    _config = DevOpsConfig.from_env()
-    return _config
+    _build_sub_config.cache_clear()
+    config = DevOpsConfig.from_env()
+    with _config_lock:
+        _config = config
+    return config
@@ -12,7 +12,9 @@ import click
 
 from .config import DevOpsConfig, set_config
 from .server.mcp_server import MCPDevOpsServer
+from .tools.registry import get_tool_registry
 from .utils.logging import setup_logging, get_app_logger
+from .utils.serialization import json_dumps_pretty
 
 
 @click.group()
@@ -165,29 +167,14 @@ def health(ctx):
 def list_tools(ctx, category: Optional[str]):
     """List available tools"""
 
-    config: DevOpsConfig = ctx.obj["config"]
-
-    async def get_tools():
-        server = MCPDevOpsServer(config)
-        await server.initialize()
-
-        if category:
-            tools = server.tool_registry.list_tools(category)
-            categories = [category]
-        else:
-            tools = server.tool_registry.list_tools()
-            categories = server.tool_registry.list_categories()
-
-        await server.shutdown()
-        return tools, categories
-
     try:
-        tools, categories = asyncio.run(get_tools())
+        tools = MCPDevOpsServer.list_registered_tools_static(category)
 
         if category:
             click.echo(f"Tools in category '{category}':")
         else:
             click.echo("Available tools:")
+            categories = get_tool_registry().list_categories()
             click.echo(f"Categories: {', '.join(categories)}")
             click.echo()
 
@@ -232,17 +219,25 @@ def validate_config(ctx):
 @click.argument("output", type=click.Path(path_type=Path))
 @click.pass_context
 def export_config(ctx, output: Path):
-    """Export current configuration to YAML file"""
+    """Export current configuration to a YAML or JSON file"""
 
     config: DevOpsConfig = ctx.obj["config"]
 
     try:
-        import yaml
-
         config_dict = config.to_dict()
 
-        with open(output, "w") as f:
-            yaml.dump(config_dict, f, default_flow_style=False, indent=2)
+        if output.suffix.lower() == ".json":
+            output.write_text(json_dumps_pretty(config_dict), encoding="utf-8")
+        else:
+            import yaml
+
+            try:
+                from yaml import CSafeDumper as Dumper
+            except ImportError:
+                from yaml import SafeDumper as Dumper
+
+            with open(output, "w") as f:
+                yaml.dump(config_dict, f, Dumper=Dumper)
 
         click.echo(f"Configuration exported to {output}")
 
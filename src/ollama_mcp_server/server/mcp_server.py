@@ -8,7 +8,7 @@ communication, tool registration, and request routing.
 import asyncio
 import signal
 import sys
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from mcp import types
 from mcp.server import Server
@@ -16,8 +16,19 @@ from mcp.server.stdio import stdio_server
 
 from ..config import get_config, DevOpsConfig
 from ..tools.registry import get_tool_registry, auto_discover_tools
-from ..tools.base_tool import ToolExecutionContext
+from ..tools.base_tool import (
+    EMPTY_CONTEXT,
+    ToolExecutionContext,
+    ToolResult,
+    ToolSchema,
+)
 from ..utils.logging import setup_logging, get_app_logger
+from ..utils.serialization import json_dumps, json_dumps_pretty
+
+
+def _text_content(text: str) -> types.TextContent:
+    """Build a text content block without re-validating its two plain fields"""
+    return types.TextContent.model_construct(type="text", text=text)
 
 
 class MCPDevOpsServer:
@@ -40,6 +51,20 @@ class MCPDevOpsServer:
         self.server: Optional[Server] = None
         self.running = False
 
+        # MCP tool list, rebuilt only when the registry version changes
+        self._tool_list_cache: List[types.Tool] = []
+        self._tool_list_version = -1
+
+        # Executions shared by identical concurrent tool calls, by cache key
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+        # Static part of the health check response
+        self._health_server_info = {
+            "name": self.config.server_name,
+            "version": self.config.server_version,
+            "environment": self.config.environment,
+        }
+
         # Setup logging
         setup_logging()
 
@@ -50,6 +75,26 @@ class MCPDevOpsServer:
             transport=self.config.transport_type,
         )
 
+    @classmethod
+    def list_registered_tools_static(
+        cls, category: Optional[str] = None
+    ) -> Tuple[ToolSchema, ...]:
+        """
+        List tool schemas without bringing a server up
+
+        Only the tool modules for the requested category are discovered, and
+        no health checks or tool cleanup are run.
+
+        Args:
+            category: Optional category filter
+
+        Returns:
+            Schemas of the registered tools
+        """
+        tool_registry = get_tool_registry()
+        auto_discover_tools(None if category is None else [category])
+        return tool_registry.list_tools(category)
+
     async def initialize(self) -> None:
         """Initialize the server and discover tools"""
         self.logger.info("Starting server initialization")
@@ -58,11 +103,11 @@ class MCPDevOpsServer:
         auto_discover_tools()
 
         # Log tool statistics
-        stats = self.tool_registry.get_tool_statistics()
+        stats = self.tool_registry.get_stats_summary()
         self.logger.info(
             "Tool discovery completed",
             total_tools=stats["total_tools"],
-            categories=stats["categories"],
+            categories=dict(stats["categories"]),
         )
 
         # Perform initial health check
@@ -88,16 +133,18 @@ class MCPDevOpsServer:
             """Handle list tools requests"""
             self.logger.debug("Handling list_tools request")
 
-            tool_schemas = self.tool_registry.list_tools()
-
-            mcp_tools = []
-            for schema in tool_schemas:
-                mcp_tool = types.Tool(
-                    name=schema.name,
-                    description=schema.description,
-                    inputSchema=schema.inputSchema,
-                )
-                mcp_tools.append(mcp_tool)
+            version = self.tool_registry.version
+            if self._tool_list_version != version:
+                self._tool_list_cache = [
+                    types.Tool(
+                        name=schema.name,
+                        description=schema.description,
+                        inputSchema=schema.inputSchema,
+                    )
+                    for schema in self.tool_registry.list_tools()
+                ]
+                self._tool_list_version = version
+            mcp_tools = self._tool_list_cache
 
             self.logger.debug(
                 "Returning tool list",
@@ -124,18 +171,14 @@ class MCPDevOpsServer:
             except ValueError as e:
                 error_msg = str(e)
                 self.logger.error("Tool not found", tool_name=name, error=error_msg)
-                return [types.TextContent(type="text", text=f"Error: {error_msg}")]
+                return [_text_content(f"Error: {error_msg}")]
 
-            # Create execution context
-            context = ToolExecutionContext()
+            # Requests carry no caller details, so share the empty context
+            context = EMPTY_CONTEXT
 
             # Execute the tool
             try:
-                result = await self.tool_registry.execute_tool(
-                    tool_name=name,
-                    arguments=arguments or {},
-                    context=context,
-                )
+                result = await self._execute_coalesced(name, arguments or {}, context)
 
                 if result.success:
                     # Format successful result
@@ -155,7 +198,7 @@ class MCPDevOpsServer:
                         execution_time=result.execution_time,
                     )
 
-                return [types.TextContent(type="text", text=response_text)]
+                return [_text_content(response_text)]
 
             except Exception as e:
                 error_msg = f"Tool execution exception: {str(e)}"
@@ -165,25 +208,81 @@ class MCPDevOpsServer:
                     error=str(e),
                     exc_info=True,
                 )
-                return [types.TextContent(type="text", text=error_msg)]
+                return [_text_content(error_msg)]
 
         return server
 
+    async def _execute_coalesced(
+        self,
+        name: str,
+        arguments: Dict[str, Any],
+        context: ToolExecutionContext,
+    ) -> ToolResult:
+        """
+        Execute a tool, sharing one execution between identical concurrent calls
+
+        Only calls the tool gives a cache key are coalesced, as only
+        those may be answered from another caller's execution. The shared
+        execution is shielded so a cancelled caller does not cancel it for the
+        others.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+            context: Execution context
+
+        Returns:
+            Tool execution result
+        """
+        tool = self.tool_registry.get_tool(name)
+        key = None
+        if tool is not None and self.config.tools.enable_caching:
+            try:
+                key = tool.get_cache_key(arguments)
+            except (TypeError, ValueError):
+                key = None
+        if key is None:
+            return await self.tool_registry.execute_tool(name, arguments, context)
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self.tool_registry.execute_tool(name, arguments, context)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.logger.debug("Joining in-flight tool execution", tool_name=name)
+
+        return await asyncio.shield(task)
+
     def _format_tool_result(self, result) -> str:
         """Format tool result for response"""
-        import json
-
-        if result.data is None:
+        data = result.data
+        if data is None:
             return "Tool executed successfully (no data returned)"
 
-        # Try to format as JSON if it's a dict/list
-        if isinstance(result.data, (dict, list)):
+        tools_config = self.config.tools
+
+        # Text payloads pass through; bytes are decoded rather than repr'd
+        text = None
+        if isinstance(data, str):
+            text = data
+        elif isinstance(data, (bytes, bytearray)):
+            text = bytes(data).decode("utf-8", errors="replace")
+        elif isinstance(data, (dict, list)):
+            dumps = json_dumps_pretty if tools_config.pretty_json else json_dumps
             try:
-                return json.dumps(result.data, indent=2, ensure_ascii=False)
+                text = dumps(data)
             except (TypeError, ValueError):
-                return str(result.data)
+                pass
+        if text is None:
+            text = str(data)
 
-        return str(result.data)
+        limit = tools_config.max_result_chars
+        if len(text) > limit:
+            return f"{text[:limit]}\n... [truncated {len(text) - limit} characters]"
+        return text
 
     async def run_stdio(self) -> None:
         """Run the server with stdio transport"""
@@ -191,18 +290,30 @@ class MCPDevOpsServer:
 
         server = self.create_server()
 
-        # Set up signal handlers for graceful shutdown
-        def signal_handler(signum, frame):
+        loop = asyncio.get_running_loop()
+        stop_requested = asyncio.Event()
+
+        # Signals only flag the stop; the wait below then shuts down promptly
+        def request_stop(signum: int) -> None:
             self.logger.info(f"Received signal {signum}, shutting down...")
             self.running = False
+            stop_requested.set()
 
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
-
-        try:
-            self.running = True
+        loop_handled_signals = []
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, request_stop, sig)
+                loop_handled_signals.append(sig)
+            except NotImplementedError:
+                # Event loops without signal support (Windows)
+                signal.signal(
+                    sig,
+                    lambda signum, frame: loop.call_soon_threadsafe(
+                        request_stop, signum
+                    ),
+                )
 
-            # Run the stdio server
+        async def serve() -> None:
             async with stdio_server() as (read_stream, write_stream):
                 await server.run(
                     read_stream,
@@ -210,10 +321,29 @@ class MCPDevOpsServer:
                     self.config.server_name,
                 )
 
+        serve_task = asyncio.create_task(serve())
+        stop_task = asyncio.create_task(stop_requested.wait())
+
+        try:
+            self.running = True
+
+            # Run the stdio server until it ends or a stop is requested
+            await asyncio.wait(
+                (serve_task, stop_task), return_when=asyncio.FIRST_COMPLETED
+            )
+            if serve_task.done():
+                serve_task.result()
+
         except Exception as e:
             self.logger.error("Server error", error=str(e), exc_info=True)
             raise
         finally:
+            # The stdio reader thread only returns on EOF, so the serve task is
+            # cancelled without waiting for it before tools are shut down
+            serve_task.cancel()
+            stop_task.cancel()
+            for sig in loop_handled_signals:
+                loop.remove_signal_handler(sig)
             await self.shutdown()
 
     async def run_http(self) -> None:
@@ -241,18 +371,23 @@ class MCPDevOpsServer:
 
         self.running = False
 
-        # Close any open connections in tools
-        for tool_name in self.tool_registry.list_tools():
-            tool = self.tool_registry.get_tool(tool_name.name)
-            if tool and hasattr(tool, "cleanup"):
-                try:
-                    await tool.cleanup()
-                except Exception as e:
-                    self.logger.error(
-                        "Error during tool cleanup",
-                        tool_name=tool_name.name,
-                        error=str(e),
-                    )
+        # Close any open connections in tools, all tools at once
+        tool_names = []
+        cleanups = []
+        for tool in self.tool_registry.iter_tools():
+            cleanup = getattr(tool, "cleanup", None)
+            if cleanup is not None:
+                tool_names.append(tool.name)
+                cleanups.append(cleanup())
+
+        results = await asyncio.gather(*cleanups, return_exceptions=True)
+        for tool_name, result in zip(tool_names, results):
+            if isinstance(result, Exception):
+                self.logger.error(
+                    "Error during tool cleanup",
+                    tool_name=tool_name,
+                    error=str(result),
+                )
 
         # Clear tool caches
         self.tool_registry.clear_all_caches()
@@ -278,12 +413,7 @@ class MCPDevOpsServer:
 
         health_data = {
             "status": "healthy" if overall_health else "degraded",
-            "server": {
-                "name": self.config.server_name,
-                "version": self.config.server_version,
-                "environment": self.config.environment,
-                "running": self.running,
-            },
+            "server": {**self._health_server_info, "running": self.running},
             "tools": {
                 "total": total_tools,
                 "healthy": healthy_tools,
@@ -6,14 +6,17 @@ the common interface and functionality.
 """
 
 import asyncio
+import hashlib
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
-from pydantic import BaseModel, Field
-import structlog
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+import fastjsonschema
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 from ..config import get_config
-from ..utils.logging import audit_logger, performance_logger
+from ..utils.logging import audit_logger, get_logger, performance_logger
+from ..utils.serialization import json_dumps_sorted
 
 
 class ToolSchema(BaseModel):
@@ -23,8 +26,8 @@ class ToolSchema(BaseModel):
     description: str = Field(description="Tool description")
     inputSchema: Dict[str, Any] = Field(description="JSON schema for tool input")
 
-    class Config:
-        extra = "forbid"
+    # Frozen because one instance is shared by every tool of a class
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class ToolResult(BaseModel):
@@ -40,8 +43,7 @@ class ToolResult(BaseModel):
         default=None, description="Execution time in seconds"
     )
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class ToolExecutionContext(BaseModel):
@@ -58,8 +60,69 @@ class ToolExecutionContext(BaseModel):
         default=None, description="Execution timeout in seconds"
     )
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+
+# Shared context for executions that carry no caller details
+EMPTY_CONTEXT = ToolExecutionContext()
+
+
+def compile_input_schema(
+    schema: Dict[str, Any],
+) -> Optional[Callable[[Dict[str, Any]], Any]]:
+    """
+    Compile a JSON schema into a specialized validator function
+
+    Args:
+        schema: JSON schema for tool input
+
+    Returns:
+        Validator raising fastjsonschema.JsonSchemaException on invalid input,
+        or None if the schema only requires an object
+    """
+    if set(schema) <= {"type"}:
+        return None
+
+    return fastjsonschema.compile(schema, use_default=False)
+
+
+class _TTLCache:
+    """Size-bounded LRU cache whose entries expire a fixed time after insertion"""
+
+    __slots__ = ("maxsize", "_data")
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the live value for key, dropping it if it has expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store value for ttl seconds, evicting the least recently used entries"""
+        data = self._data
+        data[key] = (time.monotonic() + ttl, value)
+        data.move_to_end(key)
+        while len(data) > self.maxsize:
+            data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
 
 
 class BaseTool(ABC):
@@ -70,10 +133,45 @@ class BaseTool(ABC):
     logging, and execution timing for all tools.
     """
 
+    __slots__ = (
+        "config",
+        "logger",
+        "_cache",
+        "_cache_key_prefix",
+    )
+
+    # ToolSchema cached per class by the schema property
+    _schema: Optional[ToolSchema] = None
+
+    # Validator compiled per class from input_schema by _get_input_validator,
+    # read from the class __dict__ so it is never bound as a method
+    _input_validator: Optional[Callable[[Dict[str, Any]], Any]] = None
+
+    # Optional pydantic model for the arguments; when set it is used for
+    # validation instead of the input schema
+    input_model: Optional[Type[BaseModel]] = None
+
+    # Whether health_check() probes something worth awaiting; tools that keep
+    # the default implementation report `available` without being called
+    requires_health_check: bool = False
+
+    # Static health, e.g. whether the tool's optional dependency imported
+    available: bool = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        if (
+            "health_check" in cls.__dict__
+            and "requires_health_check" not in cls.__dict__
+        ):
+            cls.requires_health_check = True
+
     def __init__(self):
         self.config = get_config()
-        self.logger = structlog.get_logger(self.__class__.__name__)
-        self._cache: Dict[str, Any] = {}
+        self.logger = get_logger(type(self).__name__)
+        self._cache = _TTLCache(self.config.tools.cache_max_entries)
+        self._cache_key_prefix = f"{self.name}:"
 
     @property
     @abstractmethod
@@ -92,12 +190,17 @@ class BaseTool(ABC):
 
     @property
     def schema(self) -> ToolSchema:
-        """Get the complete tool schema"""
-        return ToolSchema(
-            name=self.name,
-            description=self.description,
-            inputSchema=self.input_schema,
-        )
+        """Get the complete tool schema, built once per tool class"""
+        cls = type(self)
+        schema = cls.__dict__.get("_schema")
+        if schema is None:
+            schema = ToolSchema(
+                name=self.name,
+                description=self.description,
+                inputSchema=self.input_schema,
+            )
+            cls._schema = schema
+        return schema
 
     @abstractmethod
     async def _execute(self, arguments: Dict[str, Any]) -> Any:
@@ -127,80 +230,81 @@ class BaseTool(ABC):
         Raises:
             ValueError: If validation fails
         """
-        # Basic validation - can be enhanced with jsonschema
         if not isinstance(arguments, dict):
             raise ValueError("Arguments must be a dictionary")
 
-        return arguments
+        if self.input_model is not None:
+            try:
+                return self.input_model.model_validate(arguments).model_dump()
+            except ValidationError as e:
+                raise ValueError(f"Invalid arguments: {e}") from e
 
-    def should_cache_result(self, arguments: Dict[str, Any]) -> bool:
-        """
-        Determine if the result should be cached
+        validator = self._get_input_validator()
+        if validator is not None:
+            try:
+                validator(arguments)
+            except fastjsonschema.JsonSchemaException as e:
+                raise ValueError(f"Invalid arguments: {e.message}") from e
 
-        Args:
-            arguments: Tool arguments
+        return arguments
 
-        Returns:
-            True if result should be cached
-        """
-        return self.config.tools.enable_caching
+    def _get_input_validator(self) -> Optional[Callable[[Dict[str, Any]], Any]]:
+        """Validator for the input schema, compiled once per tool class"""
+        cls = type(self)
+        try:
+            return cls.__dict__["_input_validator"]
+        except KeyError:
+            validator = compile_input_schema(self.input_schema)
+            cls._input_validator = validator
+            return validator
 
-    def get_cache_key(self, arguments: Dict[str, Any]) -> str:
+    def get_cache_key(self, arguments: Dict[str, Any]) -> Optional[str]:
         """
         Generate cache key for the given arguments
 
+        Only called when caching is enabled. Subclasses can override this
+        and return None to skip the cache for particular arguments.
+
         Args:
             arguments: Tool arguments
 
         Returns:
-            Cache key string
+            Cache key string, or None if the result should not be cached
         """
-        import hashlib
-        import json
-
         # Create deterministic hash of arguments
-        args_str = json.dumps(arguments, sort_keys=True)
-        return f"{self.name}:{hashlib.md5(args_str.encode()).hexdigest()}"
+        digest = hashlib.blake2b(json_dumps_sorted(arguments), digest_size=16)
+        return self._cache_key_prefix + digest.hexdigest()
 
     def get_cached_result(self, cache_key: str) -> Optional[Any]:
         """
         Get cached result if available and valid
 
+        Only called when caching is enabled.
+
         Args:
             cache_key: Cache key
 
         Returns:
             Cached result or None
         """
-        if not self.config.tools.enable_caching:
-            return None
+        return self._cache.get(cache_key)
 
-        cached_entry = self._cache.get(cache_key)
-        if cached_entry is None:
-            return None
-
-        # Check if cache entry is still valid
-        if time.time() - cached_entry["timestamp"] > self.config.tools.cache_ttl:
-            del self._cache[cache_key]
-            return None
-
-        return cached_entry["result"]
-
-    def cache_result(self, cache_key: str, result: Any) -> None:
+    def cache_result(
+        self, cache_key: str, result: Any, ttl: Optional[float] = None
+    ) -> None:
         """
         Cache the execution result
 
+        Only called when caching is enabled.
+
         Args:
             cache_key: Cache key
             result: Result to cache
+            ttl: Seconds to keep the result, the configured cache TTL if omitted
         """
-        if not self.config.tools.enable_caching:
-            return
-
-        self._cache[cache_key] = {
-            "result": result,
-            "timestamp": time.time(),
-        }
+        if ttl is None:
+            ttl = self.config.tools.cache_ttl
+        self._cache.set(cache_key, result, ttl)
 
     async def execute(
         self,
@@ -217,8 +321,9 @@ class BaseTool(ABC):
         Returns:
             Tool execution result
         """
-        start_time = time.time()
-        context = context or ToolExecutionContext()
+        start_time = time.perf_counter()
+        if context is None:
+            context = EMPTY_CONTEXT
 
         try:
             # Log tool execution start
@@ -233,36 +338,41 @@ class BaseTool(ABC):
             # Validate arguments
             validated_args = self.validate_arguments(arguments)
 
+            # Tool settings are read once per execution
+            tools_config = self.config.tools
+
             # Check cache if enabled
             cache_key = None
-            if self.should_cache_result(validated_args):
+            if tools_config.enable_caching:
                 cache_key = self.get_cache_key(validated_args)
+            if cache_key is not None:
                 cached_result = self.get_cached_result(cache_key)
                 if cached_result is not None:
                     performance_logger.log_cache_metrics(cache_key, hit=True)
-                    return ToolResult(
+                    return ToolResult.model_construct(
                         success=True,
                         data=cached_result,
-                        execution_time=time.time() - start_time,
+                        execution_time=time.perf_counter() - start_time,
                         metadata={"cached": True},
                     )
                 performance_logger.log_cache_metrics(cache_key, hit=False)
 
             # Execute tool with timeout
-            timeout = context.timeout or self.config.tools.execution_timeout
+            timeout = context.timeout or tools_config.execution_timeout
             try:
-                result = await asyncio.wait_for(
-                    self._execute(validated_args),
-                    timeout=timeout,
-                )
-            except asyncio.TimeoutError:
+                async with asyncio.timeout(timeout) as deadline:
+                    result = await self._execute(validated_args)
+            except TimeoutError:
+                # Timeouts raised by the tool itself keep their own message
+                if not deadline.expired():
+                    raise
                 raise TimeoutError(f"Tool execution timed out after {timeout} seconds")
 
             # Cache result if appropriate
             if cache_key is not None:
-                self.cache_result(cache_key, result)
+                self.cache_result(cache_key, result, tools_config.cache_ttl)
 
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
 
             # Log successful execution
             audit_logger.log_tool_execution(
@@ -284,14 +394,14 @@ class BaseTool(ABC):
                 execution_time=execution_time,
             )
 
-            return ToolResult(
+            return ToolResult.model_construct(
                 success=True,
                 data=result,
                 execution_time=execution_time,
             )
 
         except Exception as e:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             error_message = str(e)
 
             # Log failed execution
@@ -317,7 +427,7 @@ class BaseTool(ABC):
                 exc_info=True,
             )
 
-            return ToolResult(
+            return ToolResult.model_construct(
                 success=False,
                 error=error_message,
                 execution_time=execution_time,
@@ -335,13 +445,5 @@ class BaseTool(ABC):
         Returns:
             True if the tool is healthy
         """
-        try:
-            # Default implementation - can be overridden by subclasses
-            return True
-        except Exception as e:
-            self.logger.error(
-                "Tool health check failed",
-                tool_name=self.name,
-                error=str(e),
-            )
-            return False
+        # Default implementation - can be overridden by subclasses
+        return self.available
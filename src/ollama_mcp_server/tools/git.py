@@ -5,8 +5,17 @@ This module provides tools for Git operations and repository management.
 """
 
 import asyncio
+import contextlib
+import os
+import re
+import shutil
+import subprocess
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 try:
     import git
@@ -16,12 +25,506 @@ try:
 except ImportError:
     GIT_AVAILABLE = False
 
+# libgit2 bindings, used for the read-only status and branch listing paths
+try:
+    import pygit2
+    from pygit2.enums import FileStatus
+
+    PYGIT2_AVAILABLE = True
+except ImportError:
+    PYGIT2_AVAILABLE = False
+
 from .base_tool import BaseTool
 
+# git command line client, driven directly by tools that need no Repo object
+GIT_EXECUTABLE = shutil.which("git")
+
+if PYGIT2_AVAILABLE:
+    # Index status flags mapped to GitPython's change_type letters
+    _PYGIT2_INDEX_CHANGES = (
+        (FileStatus.INDEX_NEW, "A"),
+        (FileStatus.INDEX_MODIFIED, "M"),
+        (FileStatus.INDEX_DELETED, "D"),
+        (FileStatus.INDEX_RENAMED, "R"),
+        (FileStatus.INDEX_TYPECHANGE, "T"),
+    )
+    _PYGIT2_WORKTREE_CHANGES = (
+        (FileStatus.WT_MODIFIED, "M"),
+        (FileStatus.WT_DELETED, "D"),
+        (FileStatus.WT_RENAMED, "R"),
+        (FileStatus.WT_TYPECHANGE, "T"),
+    )
+
+
+# Blocking git work runs on its own pool so it cannot starve the default
+# executor that other tools and the event loop rely on
+_GIT_POOL = ThreadPoolExecutor(
+    max_workers=min(8, os.cpu_count() or 1), thread_name_prefix="git"
+)
+
+
+async def _run_git(*args: str) -> Tuple[int, str, str]:
+    """
+    Run a git command as a subprocess of the event loop
+
+    The process is killed if the calling task is cancelled, for example by
+    the tool execution timeout.
+
+    Args:
+        args: git arguments
+
+    Returns:
+        Exit code, stdout and stderr
+    """
+    process = await asyncio.create_subprocess_exec(
+        GIT_EXECUTABLE,
+        *args,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=os.environ | {"GIT_TERMINAL_PROMPT": "0"},
+    )
+    try:
+        stdout, stderr = await process.communicate()
+    except BaseException:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        raise
+
+    return (
+        process.returncode,
+        stdout.decode("utf-8", errors="replace"),
+        stderr.decode("utf-8", errors="replace"),
+    )
+
+
+# Repo objects reused across tool calls, most recently used last, with the
+# identity of their git directory when opened
+_REPO_CACHE_SIZE = 32
+_RepoEntry = Tuple["Repo", threading.Lock, Optional[Tuple[int, int]]]
+_repo_cache: "OrderedDict[Path, _RepoEntry]" = OrderedDict()
+_repo_cache_lock = threading.Lock()
+
+
+def _git_dir_id(git_dir: str) -> Optional[Tuple[int, int]]:
+    """Device and inode of a git directory, or None if it is gone"""
+    try:
+        stat = os.stat(git_dir)
+    except OSError:
+        return None
+    return stat.st_dev, stat.st_ino
+
+
+@contextlib.contextmanager
+def _open_repo(repo_path: Path) -> Iterator["Repo"]:
+    """
+    Borrow the cached GitPython Repo for a path
+
+    Repo objects keep long-running git helper processes that are not thread
+    safe, so each one is used by one worker thread at a time.
+
+    Args:
+        repo_path: Absolute path inside the repository
+
+    Yields:
+        The repository
+
+    Raises:
+        ValueError: If no repository contains the path
+    """
+    with _repo_cache_lock:
+        entry = _repo_cache.get(repo_path)
+        if entry is not None:
+            _repo_cache.move_to_end(repo_path)
+
+    # A few stats replace the parent directory walk; a repository removed,
+    # re-created at the same place or nested below it is opened afresh
+    if entry is not None and (
+        _git_dir_id(entry[0].git_dir) != entry[2]
+        or _nested_repo_created(repo_path, entry[0].git_dir)
+    ):
+        _forget_repo(repo_path)
+        entry = None
+
+    if entry is None:
+        try:
+            repo = Repo(repo_path, search_parent_directories=True)
+        except git.InvalidGitRepositoryError:
+            raise ValueError(f"No Git repository found at {repo_path}")
+
+        with _repo_cache_lock:
+            entry = _repo_cache.setdefault(
+                repo_path, (repo, threading.Lock(), _git_dir_id(repo.git_dir))
+            )
+            while len(_repo_cache) > _REPO_CACHE_SIZE:
+                _repo_cache.popitem(last=False)
+
+    repo, lock, _ = entry
+    with lock:
+        yield repo
+
+
+def _forget_repo(repo_path: Path) -> None:
+    """Drop and close the cached Repo for a path after it was modified"""
+    with _repo_cache_lock:
+        entry = _repo_cache.pop(repo_path, None)
+    if entry is not None:
+        repo, lock, _ = entry
+        with lock:
+            repo.close()
+
+
+# Git directories found by pygit2 per input path, most recently used last,
+# with the mtime of their HEAD when discovered
+_GIT_DIR_CACHE_SIZE = 128
+_git_dir_cache: "OrderedDict[Path, Tuple[str, int]]" = OrderedDict()
+_git_dir_cache_lock = threading.Lock()
+
+
+def _head_mtime(git_dir: str) -> Optional[int]:
+    """Modification time of a git directory's HEAD, or None if it is gone"""
+    try:
+        return os.stat(os.path.join(git_dir, "HEAD")).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _nested_repo_created(repo_path: Path, git_dir: str) -> bool:
+    """Whether a repository now exists between repo_path and git_dir's worktree"""
+    git_dir_path = Path(git_dir)
+    if git_dir_path.name != ".git":
+        return False
+
+    worktree = git_dir_path.parent
+    for directory in (repo_path, *repo_path.parents):
+        if directory == worktree:
+            return False
+        if os.path.lexists(directory / ".git"):
+            return True
+    return False
+
+
+def _discover_git_dir(repo_path: Path) -> str:
+    """
+    Git directory of the repository containing repo_path
+
+    Discovery walks the parent directories, so the result is cached and only
+    rechecked with a stat of HEAD plus one per directory below the worktree.
+
+    Raises:
+        ValueError: If no repository contains the path
+    """
+    with _git_dir_cache_lock:
+        entry = _git_dir_cache.get(repo_path)
+        if entry is not None:
+            _git_dir_cache.move_to_end(repo_path)
+
+    if entry is not None:
+        git_dir, head_mtime = entry
+        if _head_mtime(git_dir) == head_mtime and not _nested_repo_created(
+            repo_path, git_dir
+        ):
+            return git_dir
+        with _git_dir_cache_lock:
+            _git_dir_cache.pop(repo_path, None)
+
+    git_dir = pygit2.discover_repository(str(repo_path))
+    if git_dir is None:
+        raise ValueError(f"No Git repository found at {repo_path}")
+
+    head_mtime = _head_mtime(git_dir)
+    if head_mtime is not None:
+        with _git_dir_cache_lock:
+            _git_dir_cache[repo_path] = (git_dir, head_mtime)
+            while len(_git_dir_cache) > _GIT_DIR_CACHE_SIZE:
+                _git_dir_cache.popitem(last=False)
+    return git_dir
+
+
+def _open_pygit2_repo(repo_path: Path) -> "pygit2.Repository":
+    """Open the repository containing repo_path with pygit2"""
+    return pygit2.Repository(_discover_git_dir(repo_path))
+
+
+def _clone_dir_name(url: str) -> str:
+    """
+    Directory name git clone picks for a repository URL
+
+    Follows the rules of git's own guess: scheme, credentials, trailing
+    slashes, a trailing /.git, a bare host's port and a .git suffix are
+    dropped, and colons count as path separators.
+
+    Raises:
+        ValueError: If no directory name can be derived from the URL
+    """
+    start = url.find("://")
+    name = url[start + 3 :] if start != -1 else url
+    host = re.match(r"[^/@]*@", name)
+    if host is not None:
+        name = name[host.end() :]
+
+    name = name.rstrip("/ \t\n\r\f\v")
+    if len(name) > 5 and name.endswith("/.git"):
+        name = name[:-5].rstrip("/")
+
+    if "/" not in name and ":" in name:
+        name = re.sub(r":\d*$", "", name)
+
+    name = re.split(r"[/:]", name)[-1].removesuffix(".git")
+    name = re.sub(r"[\x00-\x20]+", " ", name).strip()
+    if not name:
+        raise ValueError(f"Cannot derive a directory name from {url!r}")
+    return name
+
+
+def _pygit2_active_branch(repo: "pygit2.Repository") -> Optional[str]:
+    """Name of the checked out branch, or None if HEAD is detached"""
+    if repo.head_is_detached:
+        return None
+    if repo.head_is_unborn:
+        return repo.references["HEAD"].target.removeprefix("refs/heads/")
+    return repo.head.shorthand
+
+
+def _pygit2_commit_date(commit: "pygit2.Commit") -> str:
+    """Commit date in ISO format with the committer's UTC offset"""
+    offset = timezone(timedelta(minutes=commit.commit_time_offset))
+    return datetime.fromtimestamp(commit.commit_time, offset).isoformat()
+
+
+def _pygit2_status(repo_path: Path, untracked_mode: str = "normal") -> Dict[str, Any]:
+    """
+    Build the git_status result from libgit2's status walk
+
+    Args:
+        repo_path: Path inside the repository
+        untracked_mode: Untracked file listing mode, as for git status -u
+
+    Returns:
+        Status information in the same shape as the GitPython path
+    """
+    repo = _open_pygit2_repo(repo_path)
+
+    active_branch = _pygit2_active_branch(repo)
+
+    staged_files: List[Dict[str, str]] = []
+    unstaged_files: List[Dict[str, str]] = []
+    untracked_files: List[str] = []
+    for path, flags in repo.status(untracked_files=untracked_mode).items():
+        if flags & FileStatus.CONFLICTED:
+            # Reported like porcelain's unmerged entries, as unstaged only
+            unstaged_files.append({"path": path, "change_type": "U"})
+            continue
+        if flags & FileStatus.WT_NEW:
+            untracked_files.append(path)
+        for flag, change_type in _PYGIT2_INDEX_CHANGES:
+            if flags & flag:
+                staged_files.append({"path": path, "change_type": change_type})
+                break
+        for flag, change_type in _PYGIT2_WORKTREE_CHANGES:
+            if flags & flag:
+                unstaged_files.append({"path": path, "change_type": change_type})
+                break
+
+    status_info = {
+        "repository_path": str(Path(repo.workdir or repo.path)),
+        "current_branch": active_branch or "HEAD (detached)",
+        "is_dirty": bool(staged_files or unstaged_files),
+        "staged_files": staged_files,
+        "unstaged_files": unstaged_files,
+        "untracked_files": untracked_files if untracked_mode != "no" else None,
+    }
+
+    if repo.head_is_unborn:
+        status_info["latest_commit"] = None
+    else:
+        latest_commit = repo.head.peel(pygit2.Commit)
+        status_info["latest_commit"] = {
+            "hash": str(latest_commit.id)[:8],
+            "message": latest_commit.message.strip(),
+            "author": latest_commit.author.name,
+            "date": _pygit2_commit_date(latest_commit),
+        }
+
+    status_info["remotes"] = [
+        {"name": remote.name, "url": remote.url} for remote in repo.remotes
+    ]
+
+    return status_info
+
+
+def _porcelain_status(repo: "Repo", untracked_mode: str) -> Dict[str, Any]:
+    """
+    Read branch and file status with a single porcelain v2 status call
+
+    Args:
+        repo: GitPython repository
+        untracked_mode: Untracked file listing mode, as for git status -u
+
+    Returns:
+        current_branch, is_dirty and the staged, unstaged and untracked files
+    """
+    output = repo.git.status(
+        "--porcelain=v2", "--branch", "-z", f"--untracked-files={untracked_mode}"
+    )
+
+    current_branch = "HEAD (detached)"
+    staged_files: List[Dict[str, str]] = []
+    unstaged_files: List[Dict[str, str]] = []
+    untracked_files: List[str] = []
+
+    entries = iter(output.split("\0"))
+    for entry in entries:
+        kind = entry[:1]
+        if kind == "#":
+            if entry.startswith("# branch.head ") and entry[14:] != "(detached)":
+                current_branch = entry[14:]
+        elif kind == "1" or kind == "2":
+            fields = entry.split(" ", 8 if kind == "1" else 9)
+            index_status, worktree_status = fields[1]
+            path = fields[-1]
+            if kind == "2":
+                # Renames and copies are followed by their source path
+                next(entries, None)
+            if index_status != ".":
+                staged_files.append({"path": path, "change_type": index_status})
+            if worktree_status != ".":
+                unstaged_files.append({"path": path, "change_type": worktree_status})
+        elif kind == "u":
+            path = entry.split(" ", 10)[-1]
+            unstaged_files.append({"path": path, "change_type": "U"})
+        elif kind == "?":
+            untracked_files.append(entry[2:])
+
+    return {
+        "current_branch": current_branch,
+        "is_dirty": bool(staged_files or unstaged_files),
+        "staged_files": staged_files,
+        "unstaged_files": unstaged_files,
+        "untracked_files": untracked_files if untracked_mode != "no" else None,
+    }
+
+
+def _add_paths(repo: "Repo", paths: List[str]) -> None:
+    """
+    Stage paths with one git add, reading the pathspecs from stdin
+
+    This keeps any number of paths to a single index update without running
+    into command line length limits.
+
+    Args:
+        repo: GitPython repository
+        paths: Paths relative to the repository root
+
+    Raises:
+        git.GitCommandError: If git add fails
+    """
+    process = repo.git.add(
+        "--pathspec-from-file=-",
+        "--pathspec-file-nul",
+        istream=subprocess.PIPE,
+        as_process=True,
+    )
+    _, stderr = process.communicate("\0".join(paths).encode())
+    if process.returncode != 0:
+        raise git.GitCommandError(
+            ["git", "add"], process.returncode, stderr.decode(errors="replace")
+        )
+
+
+def _list_branches(repo: "Repo") -> Dict[str, Any]:
+    """
+    List local branches with a single git for-each-ref call
+
+    Args:
+        repo: GitPython repository
+
+    Returns:
+        Branch listing in the same shape as the pygit2 path
+    """
+    # NUL separated fields, as commit messages may span several lines
+    output = repo.git.for_each_ref(
+        "refs/heads/",
+        format="%(HEAD)%00%(refname:short)%00%(objectname:short=8)%00"
+        "%(committerdate:iso-strict)%00%(contents)%00",
+    )
+
+    fields = output.split("\0")
+    branches = []
+    active_branch = None
+    for i in range(0, len(fields) - 1, 5):
+        head, name, commit_hash, date, message = fields[i : i + 5]
+        is_active = head.lstrip("\n") == "*"
+        if is_active:
+            active_branch = name
+        branches.append(
+            {
+                "name": name,
+                "active": is_active,
+                "commit": {
+                    "hash": commit_hash,
+                    "message": message.strip(),
+                    "date": date,
+                },
+            }
+        )
+
+    if active_branch is None:
+        # HEAD is detached, or on a branch that has no commits yet
+        active_branch = (
+            repo.git.symbolic_ref("--short", "-q", "HEAD", with_exceptions=False)
+            or None
+        )
+
+    return {
+        "operation": "list",
+        "branches": branches,
+        "active_branch": active_branch,
+    }
+
+
+def _pygit2_list_branches(repo_path: Path) -> Dict[str, Any]:
+    """
+    List local branches with pygit2
+
+    Args:
+        repo_path: Path inside the repository
+
+    Returns:
+        Branch listing in the same shape as the GitPython path
+    """
+    repo = _open_pygit2_repo(repo_path)
+    active_branch = _pygit2_active_branch(repo)
+
+    local_branches = repo.branches.local
+    branches = []
+    for name in sorted(local_branches):
+        commit = local_branches[name].peel(pygit2.Commit)
+        branches.append(
+            {
+                "name": name,
+                "active": name == active_branch,
+                "commit": {
+                    "hash": str(commit.id)[:8],
+                    "message": commit.message.strip(),
+                    "date": _pygit2_commit_date(commit),
+                },
+            }
+        )
+
+    return {
+        "operation": "list",
+        "branches": branches,
+        "active_branch": active_branch,
+    }
+
 
 class GitStatus(BaseTool):
     """Get Git repository status"""
 
+    available = GIT_AVAILABLE
+
     def __init__(self):
         super().__init__()
 
@@ -53,6 +556,13 @@ class GitStatus(BaseTool):
                     "description": "Include ignored files in the status",
                     "default": False,
                 },
+                "untracked_mode": {
+                    "type": "string",
+                    "enum": ["all", "normal", "no"],
+                    "description": "How to list untracked files: every file, untracked "
+                    "directories collapsed, or not at all (skips the worktree scan)",
+                    "default": "normal",
+                },
             },
             "additionalProperties": False,
         }
@@ -61,11 +571,13 @@ class GitStatus(BaseTool):
         """Execute the Git status command"""
         repo_path = arguments.get("repository_path", ".")
         include_ignored = arguments.get("include_ignored", False)
+        untracked_mode = arguments.get("untracked_mode", "normal")
 
         self.logger.info(
             "Getting Git repository status",
             repository_path=repo_path,
             include_ignored=include_ignored,
+            untracked_mode=untracked_mode,
         )
 
         def get_git_status():
@@ -75,94 +587,59 @@ class GitStatus(BaseTool):
             # Convert to absolute path
             repo_path_abs = Path(repo_path).resolve()
 
-            # Find Git repository
-            try:
-                repo = Repo(repo_path_abs, search_parent_directories=True)
-            except git.InvalidGitRepositoryError:
-                raise ValueError(f"No Git repository found at {repo_path_abs}")
-
-            # Get current branch
-            try:
-                current_branch = repo.active_branch.name
-            except TypeError:
-                current_branch = "HEAD (detached)"
-
-            # Get status information
-            status_info = {
-                "repository_path": str(repo.working_dir),
-                "current_branch": current_branch,
-                "is_dirty": repo.is_dirty(),
-                "staged_files": [],
-                "unstaged_files": [],
-                "untracked_files": list(repo.untracked_files),
-            }
+            if PYGIT2_AVAILABLE:
+                return _pygit2_status(repo_path_abs, untracked_mode)
 
-            # Get staged files
-            staged_files = repo.index.diff("HEAD")
-            for item in staged_files:
-                status_info["staged_files"].append(
-                    {
-                        "path": item.a_path,
-                        "change_type": item.change_type,
-                    }
-                )
+            # Find Git repository, serializing use of the cached Repo
+            with _open_repo(repo_path_abs) as repo:
+                # Get branch and file status
+                status_info = {
+                    "repository_path": str(repo.working_dir),
+                    **_porcelain_status(repo, untracked_mode),
+                }
 
-            # Get unstaged files
-            unstaged_files = repo.index.diff(None)
-            for item in unstaged_files:
-                status_info["unstaged_files"].append(
-                    {
-                        "path": item.a_path,
-                        "change_type": item.change_type,
+                # Get commit information
+                try:
+                    latest_commit = repo.head.commit
+                    status_info["latest_commit"] = {
+                        "hash": latest_commit.hexsha[:8],
+                        "message": latest_commit.message.strip(),
+                        "author": str(latest_commit.author),
+                        "date": latest_commit.committed_datetime.isoformat(),
                     }
-                )
+                except Exception:
+                    status_info["latest_commit"] = None
 
-            # Get commit information
-            try:
-                latest_commit = repo.head.commit
-                status_info["latest_commit"] = {
-                    "hash": latest_commit.hexsha[:8],
-                    "message": latest_commit.message.strip(),
-                    "author": str(latest_commit.author),
-                    "date": latest_commit.committed_datetime.isoformat(),
-                }
-            except Exception:
-                status_info["latest_commit"] = None
-
-            # Get remote information
-            remotes = []
-            for remote in repo.remotes:
-                remotes.append(
-                    {
-                        "name": remote.name,
-                        "url": list(remote.urls)[0] if remote.urls else None,
-                    }
-                )
-            status_info["remotes"] = remotes
+                # Get remote information
+                remotes = []
+                for remote in repo.remotes:
+                    remotes.append(
+                        {
+                            "name": remote.name,
+                            "url": list(remote.urls)[0] if remote.urls else None,
+                        }
+                    )
+                status_info["remotes"] = remotes
 
-            return status_info
+                return status_info
 
-        # Execute in thread pool
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, get_git_status)
+        # Execute in the git thread pool
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(_GIT_POOL, get_git_status)
 
         return result
 
-    async def health_check(self) -> bool:
-        """Check if Git is available"""
-        return GIT_AVAILABLE
-
 
 class GitClone(BaseTool):
     """Clone a Git repository"""
 
+    available = GIT_EXECUTABLE is not None
+
     def __init__(self):
         super().__init__()
 
-        if not GIT_AVAILABLE:
-            self.logger.warning(
-                "GitPython library not available, tool will be disabled"
-            )
+        if GIT_EXECUTABLE is None:
+            self.logger.warning("git executable not found, tool will be disabled")
 
     @property
     def name(self) -> str:
@@ -192,9 +669,21 @@ class GitClone(BaseTool):
                 },
                 "depth": {
                     "type": "integer",
-                    "description": "Create a shallow clone with specified depth",
+                    "description": "Create a shallow clone with specified depth "
+                    "(defaults to 1 unless full_history is set)",
                     "minimum": 1,
                 },
+                "full_history": {
+                    "type": "boolean",
+                    "description": "Clone the full history of all branches instead of "
+                    "a shallow single-branch clone",
+                    "default": False,
+                },
+                "filter_blobs": {
+                    "type": "boolean",
+                    "description": "Make a partial clone that fetches file contents on demand",
+                    "default": False,
+                },
                 "recursive": {
                     "type": "boolean",
                     "description": "Clone submodules recursively",
@@ -211,6 +700,8 @@ class GitClone(BaseTool):
         destination = arguments.get("destination")
         branch = arguments.get("branch")
         depth = arguments.get("depth")
+        full_history = arguments.get("full_history", False)
+        filter_blobs = arguments.get("filter_blobs", False)
         recursive = arguments.get("recursive", False)
 
         self.logger.info(
@@ -219,64 +710,77 @@ class GitClone(BaseTool):
             destination=destination,
             branch=branch,
             depth=depth,
+            full_history=full_history,
             recursive=recursive,
         )
 
-        def clone_repository():
-            if not GIT_AVAILABLE:
-                raise RuntimeError("GitPython library not available")
+        if GIT_EXECUTABLE is None:
+            raise RuntimeError("git executable not found")
 
-            # Prepare clone options
-            clone_kwargs = {}
+        # Prepare clone options
+        clone_args = ["clone"]
 
-            if branch:
-                clone_kwargs["branch"] = branch
+        if branch:
+            clone_args += ["--branch", branch]
 
-            if depth:
-                clone_kwargs["depth"] = depth
+        if depth:
+            clone_args += ["--depth", str(depth)]
+        elif not full_history:
+            # Most callers only need a checkout, so skip the history
+            clone_args += ["--depth", "1", "--single-branch"]
 
-            if recursive:
-                clone_kwargs["recursive"] = True
+        if filter_blobs:
+            clone_args.append("--filter=blob:none")
 
-            # Perform clone
-            repo = Repo.clone_from(url, destination, **clone_kwargs)
+        if recursive:
+            clone_args.append("--recurse-submodules")
 
-            # Get information about the cloned repository
-            result = {
-                "repository_path": str(repo.working_dir),
-                "url": url,
-                "branch": repo.active_branch.name if repo.active_branch else "HEAD",
-                "latest_commit": {
-                    "hash": repo.head.commit.hexsha[:8],
-                    "message": repo.head.commit.message.strip(),
-                    "author": str(repo.head.commit.author),
-                    "date": repo.head.commit.committed_datetime.isoformat(),
-                },
-                "remotes": [
-                    {
-                        "name": remote.name,
-                        "url": list(remote.urls)[0] if remote.urls else None,
-                    }
-                    for remote in repo.remotes
-                ],
-            }
+        if not destination:
+            destination = _clone_dir_name(url)
 
-            return result
+        # Perform clone
+        returncode, _, stderr = await _run_git(*clone_args, "--", url, destination)
+        if returncode != 0:
+            raise RuntimeError(f"git clone failed: {stderr.strip()}")
 
-        # Execute in thread pool
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, clone_repository)
+        # Get information about the cloned repository
+        repo_dir = str(Path(destination).resolve())
+        (head_code, head, _), (log_code, log, _), (_, origin_url, _) = (
+            await asyncio.gather(
+                _run_git("-C", repo_dir, "symbolic-ref", "--short", "-q", "HEAD"),
+                _run_git(
+                    "-C", repo_dir, "log", "-1", "--format=%H%x00%an%x00%cI%x00%B"
+                ),
+                _run_git("-C", repo_dir, "config", "--get", "remote.origin.url"),
+            )
+        )
 
-        return result
+        latest_commit = None
+        if log_code == 0:
+            commit_hash, author, date, message = log.split("\0", 3)
+            latest_commit = {
+                "hash": commit_hash[:8],
+                "message": message.strip(),
+                "author": author,
+                "date": date,
+            }
+
+        result = {
+            "repository_path": repo_dir,
+            "url": url,
+            "branch": head.strip() if head_code == 0 else "HEAD",
+            "latest_commit": latest_commit,
+            "remotes": [{"name": "origin", "url": origin_url.strip() or None}],
+        }
 
-    async def health_check(self) -> bool:
-        """Check if Git is available"""
-        return GIT_AVAILABLE
+        return result
 
 
 class GitCommit(BaseTool):
     """Create a Git commit"""
 
+    available = GIT_AVAILABLE
+
     def __init__(self):
         super().__init__()
 
@@ -357,57 +861,78 @@ class GitCommit(BaseTool):
             # Convert to absolute path
             repo_path_abs = Path(repo_path).resolve()
 
-            # Find Git repository
-            try:
-                repo = Repo(repo_path_abs, search_parent_directories=True)
-            except git.InvalidGitRepositoryError:
-                raise ValueError(f"No Git repository found at {repo_path_abs}")
-
-            # Add files if specified
-            if add_all:
-                repo.git.add(A=True)
-            elif files:
-                repo.index.add(files)
-
-            # Check if there are changes to commit
-            if not repo.index.diff("HEAD"):
-                raise ValueError("No changes staged for commit")
-
-            # Create actor if name/email provided
-            actor = None
-            if author_name and author_email:
-                actor = git.Actor(author_name, author_email)
-
-            # Create commit
-            commit = repo.index.commit(message, author=actor, committer=actor)
-
-            result = {
-                "commit_hash": commit.hexsha,
-                "short_hash": commit.hexsha[:8],
-                "message": commit.message.strip(),
-                "author": str(commit.author),
-                "date": commit.committed_datetime.isoformat(),
-                "files_changed": len(commit.stats.files),
-                "insertions": commit.stats.total["insertions"],
-                "deletions": commit.stats.total["deletions"],
-            }
+            # Find Git repository, serializing use of the cached Repo
+            with _open_repo(repo_path_abs) as repo:
+                # Add files if specified, in a single git add
+                if add_all:
+                    repo.git.add(A=True)
+                elif files:
+                    _add_paths(repo, files)
+
+                # Check if there are changes to commit; the exit code says
+                # whether the index differs from HEAD without building a diff
+                staged_status, _, _ = repo.git.diff(
+                    "--cached",
+                    "--quiet",
+                    with_extended_output=True,
+                    with_exceptions=False,
+                )
+                if staged_status == 0:
+                    raise ValueError("No changes staged for commit")
+
+                # Create actor if name/email provided
+                actor = None
+                if author_name and author_email:
+                    actor = git.Actor(author_name, author_email)
+
+                # Create commit
+                commit = repo.index.commit(message, author=actor, committer=actor)
+
+                # One numstat pass for all three counts; binary files count
+                # as changed with no line totals
+                numstat = repo.git.diff_tree(
+                    "--numstat",
+                    "--no-renames",
+                    "--root",
+                    "-r",
+                    "--no-commit-id",
+                    commit.hexsha,
+                ).splitlines()
+                insertions = deletions = 0
+                for line in numstat:
+                    added, removed, _ = line.split("\t", 2)
+                    if added != "-":
+                        insertions += int(added)
+                        deletions += int(removed)
+
+                result = {
+                    "commit_hash": commit.hexsha,
+                    "short_hash": commit.hexsha[:8],
+                    "message": commit.message.strip(),
+                    "author": str(commit.author),
+                    "date": commit.committed_datetime.isoformat(),
+                    "files_changed": len(numstat),
+                    "insertions": insertions,
+                    "deletions": deletions,
+                }
+
+            # Reopen the repository on its next use after committing
+            _forget_repo(repo_path_abs)
 
             return result
 
-        # Execute in thread pool
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, create_commit)
+        # Execute in the git thread pool
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(_GIT_POOL, create_commit)
 
         return result
 
-    async def health_check(self) -> bool:
-        """Check if Git is available"""
-        return GIT_AVAILABLE
-
 
 class GitBranch(BaseTool):
     """Git branch operations"""
 
+    available = GIT_AVAILABLE
+
     def __init__(self):
         super().__init__()
 
@@ -479,90 +1004,65 @@ class GitBranch(BaseTool):
             # Convert to absolute path
             repo_path_abs = Path(repo_path).resolve()
 
-            # Find Git repository
-            try:
-                repo = Repo(repo_path_abs, search_parent_directories=True)
-            except git.InvalidGitRepositoryError:
-                raise ValueError(f"No Git repository found at {repo_path_abs}")
-
-            if operation == "list":
-                # List all branches
-                branches = []
-                for branch in repo.branches:
-                    is_active = branch == repo.active_branch
-                    branches.append(
-                        {
-                            "name": branch.name,
-                            "active": is_active,
-                            "commit": {
-                                "hash": branch.commit.hexsha[:8],
-                                "message": branch.commit.message.strip(),
-                                "date": branch.commit.committed_datetime.isoformat(),
-                            },
-                        }
-                    )
-
-                return {
-                    "operation": "list",
-                    "branches": branches,
-                    "active_branch": (
-                        repo.active_branch.name if repo.active_branch else None
-                    ),
-                }
-
-            elif operation == "create":
-                if not branch_name:
-                    raise ValueError("branch_name is required for create operation")
-
-                # Create new branch
-                new_branch = repo.create_head(branch_name, start_point or "HEAD")
-
-                return {
-                    "operation": "create",
-                    "branch_name": branch_name,
-                    "start_point": start_point or "HEAD",
-                    "commit": {
-                        "hash": new_branch.commit.hexsha[:8],
-                        "message": new_branch.commit.message.strip(),
-                    },
-                }
+            if operation == "list" and PYGIT2_AVAILABLE:
+                return _pygit2_list_branches(repo_path_abs)
+
+            # Find Git repository, serializing use of the cached Repo
+            with _open_repo(repo_path_abs) as repo:
+                if operation == "list":
+                    return _list_branches(repo)
+
+                elif operation == "create":
+                    if not branch_name:
+                        raise ValueError("branch_name is required for create operation")
+
+                    # Create new branch
+                    new_branch = repo.create_head(branch_name, start_point or "HEAD")
+
+                    return {
+                        "operation": "create",
+                        "branch_name": branch_name,
+                        "start_point": start_point or "HEAD",
+                        "commit": {
+                            "hash": new_branch.commit.hexsha[:8],
+                            "message": new_branch.commit.message.strip(),
+                        },
+                    }
 
-            elif operation == "checkout":
-                if not branch_name:
-                    raise ValueError("branch_name is required for checkout operation")
+                elif operation == "checkout":
+                    if not branch_name:
+                        raise ValueError(
+                            "branch_name is required for checkout operation"
+                        )
 
-                # Checkout branch
-                repo.git.checkout(branch_name, force=force)
+                    # Checkout branch
+                    repo.git.checkout(branch_name, force=force)
 
-                return {
-                    "operation": "checkout",
-                    "branch_name": branch_name,
-                    "force": force,
-                    "current_branch": repo.active_branch.name,
-                }
+                    return {
+                        "operation": "checkout",
+                        "branch_name": branch_name,
+                        "force": force,
+                        "current_branch": repo.active_branch.name,
+                    }
 
-            elif operation == "delete":
-                if not branch_name:
-                    raise ValueError("branch_name is required for delete operation")
+                elif operation == "delete":
+                    if not branch_name:
+                        raise ValueError("branch_name is required for delete operation")
 
-                # Delete branch
-                repo.delete_head(branch_name, force=force)
+                    # Delete branch
+                    repo.delete_head(branch_name, force=force)
 
-                return {
-                    "operation": "delete",
-                    "branch_name": branch_name,
-                    "force": force,
-                }
+                    return {
+                        "operation": "delete",
+                        "branch_name": branch_name,
+                        "force": force,
+                    }
 
-            else:
-                raise ValueError(f"Unknown operation: {operation}")
+                else:
+                    raise ValueError(f"Unknown operation: {operation}")
 
-        # Execute in thread pool
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(None, perform_branch_operation)
+        # Execute in the git thread pool
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(_GIT_POOL, perform_branch_operation)
 
         return result
-
-    async def health_check(self) -> bool:
-        """Check if Git is available"""
-        return GIT_AVAILABLE
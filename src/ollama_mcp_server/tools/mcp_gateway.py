@@ -6,7 +6,8 @@ making this server act as a gateway/proxy that can route requests to multiple
 MCP servers and aggregate their tools and resources.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+import httpx
 import structlog
 
 from mcp.client.session_group import ClientSessionGroup
@@ -15,9 +16,29 @@ from mcp.client.sse import sse_client
 
 from .base_tool import BaseTool
 
-
 logger = structlog.get_logger()
 
+# Connection pool limits shared by every SSE transport
+_SSE_POOL_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=60
+)
+# Same defaults the MCP SDK uses: long reads for the event stream
+_SSE_TIMEOUT = httpx.Timeout(30.0, read=300.0)
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Transport delegating to a shared pool that outlives each client"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        # The pool is owned and closed by MCPGatewayManager
+        pass
+
 
 class MCPGatewayManager:
     """Shared state manager for MCP Gateway tools"""
@@ -25,6 +46,7 @@ class MCPGatewayManager:
     def __init__(self):
         self.session_group = ClientSessionGroup()
         self.connected_servers = {}
+        self._sse_transport: Optional[httpx.AsyncHTTPTransport] = None
 
     def get_session_group(self):
         return self.session_group
@@ -32,6 +54,34 @@ class MCPGatewayManager:
     def get_connected_servers(self):
         return self.connected_servers
 
+    def create_http_client(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[httpx.Timeout] = None,
+        auth: Optional[httpx.Auth] = None,
+    ) -> httpx.AsyncClient:
+        """
+        Create an HTTP client for an SSE transport
+
+        Clients share one keep-alive connection pool, so reconnecting to the
+        same host skips the TCP and TLS handshakes.
+        """
+        if self._sse_transport is None:
+            self._sse_transport = httpx.AsyncHTTPTransport(limits=_SSE_POOL_LIMITS)
+
+        return httpx.AsyncClient(
+            headers=headers,
+            timeout=timeout or _SSE_TIMEOUT,
+            auth=auth,
+            transport=_SharedTransport(self._sse_transport),
+        )
+
+    async def close(self) -> None:
+        """Close the shared SSE connection pool"""
+        transport, self._sse_transport = self._sse_transport, None
+        if transport is not None:
+            await transport.aclose()
+
 
 # Global gateway manager instance
 _gateway_manager = MCPGatewayManager()
@@ -123,7 +173,11 @@ class MCPGatewayConnect(BaseTool):
 
             # Connect via SSE
             session = await self.gateway_manager.session_group.connect_to_server(
-                sse_client(sse_url), name=server_name
+                sse_client(
+                    sse_url,
+                    httpx_client_factory=self.gateway_manager.create_http_client,
+                ),
+                name=server_name,
             )
 
         # Store connection info
@@ -160,6 +214,10 @@ class MCPGatewayConnect(BaseTool):
             ),
         }
 
+    async def cleanup(self):
+        """Close the shared SSE connection pool"""
+        await self.gateway_manager.close()
+
 
 class MCPGatewayDisconnect(BaseTool):
     """Disconnect from an external MCP server"""
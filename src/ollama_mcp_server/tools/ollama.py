@@ -7,44 +7,131 @@ maintaining compatibility with the original Node.js implementation.
 
 import aiohttp
 import asyncio
-from typing import Any, Dict, Optional
+import functools
+import random
+import time
+import weakref
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from .base_tool import BaseTool
+from ..config.settings import OllamaAgentConfig
+from ..utils.serialization import json_dumps, json_loads
+
+SessionKey = Tuple[str, Optional[str], int]
+
+# Maximum number of bytes of an error response body included in error messages
+_ERROR_BODY_LIMIT = 2048
+
+# Upper bound in seconds for a single retry delay
+_MAX_BACKOFF = 30
+
+# Source of retry jitter, so concurrent callers do not retry in lockstep
+_RNG = random.Random()
+
+# Response fields shared by chat and generate results, with their defaults
+_RESPONSE_FIELD_DEFAULTS: Dict[str, Any] = {
+    "created_at": "",
+    "done": True,
+    "total_duration": 0,
+    "load_duration": 0,
+    "prompt_eval_count": 0,
+    "prompt_eval_duration": 0,
+    "eval_count": 0,
+    "eval_duration": 0,
+}
+
+# Seconds a health check result is reused for the same endpoint
+_HEALTH_CHECK_TTL = 2.0
+
+# Recent health check results (timestamp, healthy) and in-flight checks,
+# keyed like the shared sessions
+_health_results: Dict[SessionKey, Tuple[float, bool]] = {}
+_health_checks: Dict[SessionKey, "asyncio.Task[bool]"] = {}
+
+# HTTP sessions shared by all Ollama tools, per event loop and endpoint, so
+# tools talking to the same agent reuse one connection pool
+_SESSIONS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _get_loop_sessions() -> Dict[SessionKey, aiohttp.ClientSession]:
+    """Get the shared sessions bound to the running event loop"""
+    loop = asyncio.get_running_loop()
+    sessions = _SESSIONS.get(loop)
+    if sessions is None:
+        sessions = _SESSIONS[loop] = {}
+    return sessions
+
+
+@functools.lru_cache(maxsize=None)
+def _backoff_schedule(max_retries: int) -> Tuple[int, ...]:
+    """Maximum backoff delays in seconds, indexed by attempt number"""
+    return tuple(min(_MAX_BACKOFF, 1 << attempt) for attempt in range(max_retries + 1))
+
+
+class OllamaAPIError(Exception):
+    """Error response returned by the Ollama API"""
+
+    def __init__(self, message: str, status: int):
+        super().__init__(message)
+        self.status = status
+
+
+async def close_sessions() -> None:
+    """Close all shared Ollama HTTP sessions of the running event loop"""
+    sessions = _SESSIONS.pop(asyncio.get_running_loop(), {})
+    for session in sessions.values():
+        if not session.closed:
+            await session.close()
 
 
 class OllamaBaseTool(BaseTool):
     """Base class for Ollama tools with common functionality"""
 
+    __slots__ = ("ollama_config",)
+
     def __init__(self):
         super().__init__()
         self.ollama_config = self.config.ollama
-        self.sessions: Dict[str, Optional[aiohttp.ClientSession]] = {}
 
-    async def get_session(self, agent_name: str = "primary") -> aiohttp.ClientSession:
-        """Get or create HTTP session for specific Ollama agent"""
-        if (
-            agent_name not in self.sessions
-            or self.sessions[agent_name] is None
-            or self.sessions[agent_name].closed
-        ):
-            agent_config = self.ollama_config.agents.get(agent_name)
+    def _get_agent_config(self, agent_name: str) -> OllamaAgentConfig:
+        """Resolve the configuration for an agent, falling back to primary"""
+        agent_config = self.ollama_config.agents.get(agent_name)
+        if not agent_config:
+            # Fallback to primary if agent not found
+            agent_config = self.ollama_config.agents.get("primary")
             if not agent_config:
-                # Fallback to primary if agent not found
-                agent_config = self.ollama_config.agents.get("primary")
-                if not agent_config:
-                    raise Exception(
-                        f"No Ollama agent configuration found for '{agent_name}' or primary"
-                    )
-
+                raise Exception(
+                    f"No Ollama agent configuration found for '{agent_name}' or primary"
+                )
+        return agent_config
+
+    @staticmethod
+    def _get_agent_session(agent_config: OllamaAgentConfig) -> aiohttp.ClientSession:
+        """Get or create the shared HTTP session for a resolved agent config"""
+        key = (agent_config.api_url, agent_config.api_key, agent_config.timeout)
+        sessions = _get_loop_sessions()
+        session = sessions.get(key)
+        if session is None or session.closed:
             timeout = aiohttp.ClientTimeout(total=agent_config.timeout)
             headers = {}
             if agent_config.api_key:
                 headers["Authorization"] = f"Bearer {agent_config.api_key}"
 
-            self.sessions[agent_name] = aiohttp.ClientSession(
-                timeout=timeout, headers=headers
+            connector = aiohttp.TCPConnector(
+                limit=100, ttl_dns_cache=300, keepalive_timeout=60
             )
-        return self.sessions[agent_name]
+            session = aiohttp.ClientSession(
+                timeout=timeout,
+                headers=headers,
+                connector=connector,
+                json_serialize=json_dumps,
+            )
+            sessions[key] = session
+        return session
+
+    async def get_session(self, agent_name: str = "primary") -> aiohttp.ClientSession:
+        """Get or create the shared HTTP session for specific Ollama agent"""
+        return self._get_agent_session(self._get_agent_config(agent_name))
 
     async def make_ollama_request(
         self,
@@ -68,74 +155,218 @@ class OllamaBaseTool(BaseTool):
         Raises:
             Exception: If request fails
         """
-        agent_config = self.ollama_config.agents.get(agent_name)
-        if not agent_config:
-            # Fallback to primary
-            agent_config = self.ollama_config.agents.get("primary")
-            if not agent_config:
-                raise Exception(
-                    f"No Ollama agent configuration found for '{agent_name}' or primary"
-                )
+        agent_config = self._get_agent_config(agent_name)
+        session = self._get_agent_session(agent_config)
+        url = f"{agent_config.api_url}{endpoint}"
+        max_retries = agent_config.max_retries
+        backoffs = _backoff_schedule(max_retries)
 
-        session = await self.get_session(agent_name)
-        url = f"{agent_config.api_url.rstrip('/')}{endpoint}"
-
-        for attempt in range(agent_config.max_retries + 1):
+        for attempt in range(max_retries + 1):
             try:
                 async with session.request(method, url, json=data) as response:
                     if response.status == 200:
-                        return await response.json()
+                        return await response.json(loads=json_loads)
                     else:
-                        error_text = await response.text()
-                        raise Exception(
+                        error_body = await response.content.read(_ERROR_BODY_LIMIT)
+                        error_text = error_body.decode("utf-8", errors="replace")
+                        raise OllamaAPIError(
                             f"Ollama API error {response.status} for agent "
-                            f"'{agent_name}': {error_text}"
+                            f"'{agent_name}': {error_text}",
+                            response.status,
                         )
             except asyncio.TimeoutError:
-                if attempt == agent_config.max_retries:
+                if attempt == max_retries:
                     raise Exception(
                         f"Ollama API request timed out for agent '{agent_name}'"
                     )
-                await asyncio.sleep(2**attempt)  # Exponential backoff
+            except OllamaAPIError as e:
+                # Client errors (bad model name, malformed request) won't
+                # succeed on retry
+                if e.status < 500 or attempt == max_retries:
+                    raise
             except Exception:
-                if attempt == agent_config.max_retries:
+                if attempt == max_retries:
                     raise
-                await asyncio.sleep(2**attempt)
+
+            # Exponential backoff with full jitter
+            await asyncio.sleep(_RNG.uniform(0, backoffs[attempt]))
+
+    async def stream_ollama_request(
+        self,
+        endpoint: str,
+        method: str = "POST",
+        data: Optional[Dict[str, Any]] = None,
+        agent_name: str = "primary",
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Make a streaming request to the Ollama API and yield each chunk
+
+        Ollama streams newline-delimited JSON; chunks are decoded and yielded
+        as they arrive instead of buffering the whole response. Streaming
+        requests are not retried, as a partially consumed stream cannot be
+        replayed.
+
+        Args:
+            endpoint: API endpoint (e.g., "/api/chat")
+            method: HTTP method
+            data: Request data for POST requests
+            agent_name: Name of the agent/endpoint to use
+
+        Yields:
+            Decoded response chunks
+
+        Raises:
+            Exception: If the request fails or Ollama reports an error
+        """
+        agent_config = self._get_agent_config(agent_name)
+        session = self._get_agent_session(agent_config)
+        url = f"{agent_config.api_url}{endpoint}"
+
+        # A stream may legitimately run longer than the session's total
+        # timeout, so only the wait for each read is bounded
+        timeout = aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=agent_config.timeout,
+            sock_read=agent_config.timeout,
+        )
+
+        async with session.request(method, url, json=data, timeout=timeout) as response:
+            if response.status != 200:
+                error_body = await response.content.read(_ERROR_BODY_LIMIT)
+                error_text = error_body.decode("utf-8", errors="replace")
+                raise OllamaAPIError(
+                    f"Ollama API error {response.status} for agent "
+                    f"'{agent_name}': {error_text}",
+                    response.status,
+                )
+
+            # Split lines manually: a final chunk carrying a long context
+            # array can exceed the reader's line length limit. Only new data
+            # is split; pieces of an unfinished line are joined once it ends.
+            pending: List[bytes] = []
+            async for data_chunk in response.content.iter_any():
+                *lines, rest = data_chunk.split(b"\n")
+                if lines:
+                    pending.append(lines[0])
+                    lines[0] = b"".join(pending)
+                    pending.clear()
+                    for line in lines:
+                        if line.strip():
+                            yield self._decode_stream_chunk(line, agent_name)
+                if rest:
+                    pending.append(rest)
+            tail = b"".join(pending)
+            if tail.strip():
+                yield self._decode_stream_chunk(tail, agent_name)
+
+    @staticmethod
+    def _decode_stream_chunk(line: bytes, agent_name: str) -> Dict[str, Any]:
+        """Decode a single streamed chunk, raising on in-stream errors"""
+        chunk = json_loads(line)
+        if "error" in chunk:
+            raise Exception(
+                f"Ollama API error for agent '{agent_name}': {chunk['error']}"
+            )
+        return chunk
+
+    async def collect_ollama_stream(
+        self,
+        endpoint: str,
+        data: Dict[str, Any],
+        text_key: str,
+        agent_name: str = "primary",
+    ) -> Dict[str, Any]:
+        """
+        Stream a request and merge its chunks into a single response
+
+        Generated text fragments are joined as they arrive, so only the text
+        and the final chunk (which carries the timing statistics) are kept.
+
+        Args:
+            endpoint: API endpoint (e.g., "/api/generate")
+            data: Request data
+            text_key: Chunk key holding generated text; "message" refers to
+                the chat message content
+            agent_name: Name of the agent/endpoint to use
+
+        Returns:
+            The final chunk with the complete generated text
+        """
+        parts = []
+        final: Dict[str, Any] = {}
+        async for chunk in self.stream_ollama_request(
+            endpoint, method="POST", data=data, agent_name=agent_name
+        ):
+            if text_key == "message":
+                parts.append((chunk.get("message") or {}).get("content", ""))
+            else:
+                parts.append(chunk.get(text_key, ""))
+            final = chunk
+
+        text = "".join(parts)
+        if text_key == "message":
+            message = final.get("message") or {"role": "assistant"}
+            final["message"] = {**message, "content": text}
+        else:
+            final[text_key] = text
+        return final
 
     async def health_check(self, agent_name: str = "primary") -> bool:
-        """Check if Ollama service is available for specific agent"""
+        """
+        Check if Ollama service is available for specific agent
+
+        Results are reused for a short TTL and concurrent callers share a
+        single in-flight request per endpoint.
+        """
         try:
-            await self.make_ollama_request("/api/version", agent_name=agent_name)
-            return True
+            agent_config = self._get_agent_config(agent_name)
         except Exception:
             return False
 
+        key = (agent_config.api_url, agent_config.api_key, agent_config.timeout)
+        cached = _health_results.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _HEALTH_CHECK_TTL:
+            return cached[1]
+
+        task = _health_checks.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._probe_health(agent_name, key))
+            _health_checks[key] = task
+
+        # Shield the shared check so a cancelled caller does not cancel it
+        # for everyone else
+        return await asyncio.shield(task)
+
+    async def _probe_health(self, agent_name: str, key: SessionKey) -> bool:
+        """Query the agent's version endpoint and record the result"""
+        try:
+            await self.make_ollama_request("/api/version", agent_name=agent_name)
+            healthy = True
+        except Exception:
+            healthy = False
+        finally:
+            _health_checks.pop(key, None)
+
+        _health_results[key] = (time.monotonic(), healthy)
+        return healthy
+
     async def cleanup(self):
-        """Clean up all HTTP sessions"""
-        for session in self.sessions.values():
-            if session and not session.closed:
-                await session.close()
-        self.sessions.clear()
+        """Clean up the shared HTTP sessions"""
+        await close_sessions()
 
 
 class OllamaListModels(OllamaBaseTool):
     """List all available Ollama models"""
 
-    @property
-    def name(self) -> str:
-        return "ollama_list_models"
+    __slots__ = ()
 
-    @property
-    def description(self) -> str:
-        return "List all available Ollama models on the server"
+    name = "ollama_list_models"
+    description = "List all available Ollama models on the server"
 
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {},
-            "additionalProperties": False,
-        }
+    input_schema = {
+        "type": "object",
+        "properties": {},
+    }
 
     async def _execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the list models command"""
@@ -143,20 +374,17 @@ class OllamaListModels(OllamaBaseTool):
 
         response = await self.make_ollama_request("/api/tags")
 
-        models = response.get("models", [])
-
         # Format the response
-        formatted_models = []
-        for model in models:
-            formatted_models.append(
-                {
-                    "name": model.get("name", ""),
-                    "size": model.get("size", 0),
-                    "digest": model.get("digest", ""),
-                    "modified_at": model.get("modified_at", ""),
-                    "details": model.get("details", {}),
-                }
-            )
+        formatted_models = [
+            {
+                "name": model.get("name", ""),
+                "size": model.get("size", 0),
+                "digest": model.get("digest", ""),
+                "modified_at": model.get("modified_at", ""),
+                "details": model.get("details", {}),
+            }
+            for model in response.get("models", [])
+        ]
 
         return {
             "models": formatted_models,
@@ -167,84 +395,76 @@ class OllamaListModels(OllamaBaseTool):
 class OllamaChat(OllamaBaseTool):
     """Chat with an Ollama model using the chat API"""
 
-    @property
-    def name(self) -> str:
-        return "ollama_chat"
+    __slots__ = ()
 
-    @property
-    def description(self) -> str:
-        return "Chat with an Ollama model using the chat API"
+    name = "ollama_chat"
+    description = "Chat with an Ollama model using the chat API"
 
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "model": {
-                    "type": "string",
-                    "description": "The model name to use for chat (e.g., 'llama2', 'codellama')",
-                    "minLength": 1,
-                },
-                "messages": {
-                    "type": "array",
-                    "description": "Array of message objects with role and content",
-                    "minItems": 1,
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "role": {
-                                "type": "string",
-                                "enum": ["system", "user", "assistant"],
-                                "description": "The role of the message sender",
-                            },
-                            "content": {
-                                "type": "string",
-                                "description": "The content of the message",
-                                "minLength": 1,
-                            },
-                        },
-                        "required": ["role", "content"],
-                        "additionalProperties": False,
-                    },
-                },
-                "agent": {
-                    "type": "string",
-                    "description": "Agent/endpoint to use (primary, secondary, tertiary, etc.)",
-                    "default": "primary",
-                },
-                "stream": {
-                    "type": "boolean",
-                    "description": "Whether to stream the response",
-                    "default": False,
-                },
-                "options": {
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "model": {
+                "type": "string",
+                "description": "The model name to use for chat (e.g., 'llama2', 'codellama')",
+                "minLength": 1,
+            },
+            "messages": {
+                "type": "array",
+                "description": "Array of message objects with role and content",
+                "minItems": 1,
+                "items": {
                     "type": "object",
-                    "description": "Additional options for the model",
                     "properties": {
-                        "temperature": {
-                            "type": "number",
-                            "minimum": 0,
-                            "maximum": 2,
-                            "description": "Controls randomness in responses",
+                        "role": {
+                            "type": "string",
+                            "enum": ["system", "user", "assistant", "tool"],
+                            "description": "The role of the message sender",
                         },
-                        "top_p": {
-                            "type": "number",
-                            "minimum": 0,
-                            "maximum": 1,
-                            "description": "Controls diversity of responses",
-                        },
-                        "max_tokens": {
-                            "type": "integer",
-                            "minimum": 1,
-                            "description": "Maximum number of tokens to generate",
+                        "content": {
+                            "type": "string",
+                            "description": "The content of the message",
                         },
                     },
-                    "additionalProperties": True,
+                    "required": ["role", "content"],
                 },
             },
-            "required": ["model", "messages"],
-            "additionalProperties": False,
-        }
+            "agent": {
+                "type": "string",
+                "description": "Agent/endpoint to use (primary, secondary, tertiary, etc.)",
+                "default": "primary",
+            },
+            "stream": {
+                "type": "boolean",
+                "description": "Whether to stream the response",
+                "default": False,
+            },
+            "options": {
+                "type": "object",
+                "description": "Additional options for the model",
+                "properties": {
+                    "temperature": {
+                        "type": "number",
+                        "minimum": 0,
+                        "maximum": 2,
+                        "description": "Controls randomness in responses",
+                    },
+                    "top_p": {
+                        "type": "number",
+                        "minimum": 0,
+                        "maximum": 1,
+                        "description": "Controls diversity of responses",
+                    },
+                    "max_tokens": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "description": "Maximum number of tokens to generate",
+                    },
+                },
+                "additionalProperties": True,
+            },
+        },
+        "required": ["model", "messages"],
+    }
 
     async def _execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the chat command"""
@@ -269,87 +489,80 @@ class OllamaChat(OllamaBaseTool):
             "options": options,
         }
 
-        response = await self.make_ollama_request(
-            "/api/chat",
-            method="POST",
-            data=request_data,
-            agent_name=agent,
-        )
+        if stream:
+            response = await self.collect_ollama_stream(
+                "/api/chat", request_data, "message", agent_name=agent
+            )
+        else:
+            response = await self.make_ollama_request(
+                "/api/chat",
+                method="POST",
+                data=request_data,
+                agent_name=agent,
+            )
 
         return {
-            "message": response.get("message", {}),
-            "model": response.get("model", model),
+            **_RESPONSE_FIELD_DEFAULTS,
+            "message": {},
+            "model": model,
+            **response,
             "agent": agent,
-            "created_at": response.get("created_at", ""),
-            "done": response.get("done", True),
-            "total_duration": response.get("total_duration", 0),
-            "load_duration": response.get("load_duration", 0),
-            "prompt_eval_count": response.get("prompt_eval_count", 0),
-            "prompt_eval_duration": response.get("prompt_eval_duration", 0),
-            "eval_count": response.get("eval_count", 0),
-            "eval_duration": response.get("eval_duration", 0),
         }
 
 
 class OllamaGenerate(OllamaBaseTool):
     """Generate text using an Ollama model"""
 
-    @property
-    def name(self) -> str:
-        return "ollama_generate"
+    __slots__ = ()
 
-    @property
-    def description(self) -> str:
-        return "Generate text using an Ollama model with a single prompt"
+    name = "ollama_generate"
+    description = "Generate text using an Ollama model with a single prompt"
 
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "model": {
-                    "type": "string",
-                    "description": "The model name to use for generation",
-                    "minLength": 1,
-                },
-                "prompt": {
-                    "type": "string",
-                    "description": "The prompt to generate from",
-                    "minLength": 1,
-                },
-                "stream": {
-                    "type": "boolean",
-                    "description": "Whether to stream the response",
-                    "default": False,
-                },
-                "options": {
-                    "type": "object",
-                    "description": "Additional options for the model",
-                    "properties": {
-                        "temperature": {
-                            "type": "number",
-                            "minimum": 0,
-                            "maximum": 2,
-                            "description": "Controls randomness in responses",
-                        },
-                        "top_p": {
-                            "type": "number",
-                            "minimum": 0,
-                            "maximum": 1,
-                            "description": "Controls diversity of responses",
-                        },
-                        "max_tokens": {
-                            "type": "integer",
-                            "minimum": 1,
-                            "description": "Maximum number of tokens to generate",
-                        },
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "model": {
+                "type": "string",
+                "description": "The model name to use for generation",
+                "minLength": 1,
+            },
+            "prompt": {
+                "type": "string",
+                "description": "The prompt to generate from",
+                "minLength": 1,
+            },
+            "stream": {
+                "type": "boolean",
+                "description": "Whether to stream the response",
+                "default": False,
+            },
+            "options": {
+                "type": "object",
+                "description": "Additional options for the model",
+                "properties": {
+                    "temperature": {
+                        "type": "number",
+                        "minimum": 0,
+                        "maximum": 2,
+                        "description": "Controls randomness in responses",
+                    },
+                    "top_p": {
+                        "type": "number",
+                        "minimum": 0,
+                        "maximum": 1,
+                        "description": "Controls diversity of responses",
+                    },
+                    "max_tokens": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "description": "Maximum number of tokens to generate",
                     },
-                    "additionalProperties": True,
                 },
+                "additionalProperties": True,
             },
-            "required": ["model", "prompt"],
-            "additionalProperties": False,
-        }
+        },
+        "required": ["model", "prompt"],
+    }
 
     async def _execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the generate command"""
@@ -372,57 +585,50 @@ class OllamaGenerate(OllamaBaseTool):
             "options": options,
         }
 
-        response = await self.make_ollama_request(
-            "/api/generate",
-            method="POST",
-            data=request_data,
-        )
+        if stream:
+            response = await self.collect_ollama_stream(
+                "/api/generate", request_data, "response"
+            )
+        else:
+            response = await self.make_ollama_request(
+                "/api/generate",
+                method="POST",
+                data=request_data,
+            )
 
         return {
-            "response": response.get("response", ""),
-            "model": response.get("model", model),
-            "created_at": response.get("created_at", ""),
-            "done": response.get("done", True),
-            "context": response.get("context", []),
-            "total_duration": response.get("total_duration", 0),
-            "load_duration": response.get("load_duration", 0),
-            "prompt_eval_count": response.get("prompt_eval_count", 0),
-            "prompt_eval_duration": response.get("prompt_eval_duration", 0),
-            "eval_count": response.get("eval_count", 0),
-            "eval_duration": response.get("eval_duration", 0),
+            **_RESPONSE_FIELD_DEFAULTS,
+            "response": "",
+            "model": model,
+            "context": [],
+            **response,
         }
 
 
 class OllamaPullModel(OllamaBaseTool):
     """Pull/download an Ollama model"""
 
-    @property
-    def name(self) -> str:
-        return "ollama_pull_model"
+    __slots__ = ()
 
-    @property
-    def description(self) -> str:
-        return "Pull/download an Ollama model to the local server"
+    name = "ollama_pull_model"
+    description = "Pull/download an Ollama model to the local server"
 
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "name": {
-                    "type": "string",
-                    "description": "The name of the model to pull (e.g., 'llama2', 'codellama:7b')",
-                    "minLength": 1,
-                },
-                "stream": {
-                    "type": "boolean",
-                    "description": "Whether to stream the download progress",
-                    "default": False,
-                },
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "name": {
+                "type": "string",
+                "description": "The name of the model to pull (e.g., 'llama2', 'codellama:7b')",
+                "minLength": 1,
             },
-            "required": ["name"],
-            "additionalProperties": False,
-        }
+            "stream": {
+                "type": "boolean",
+                "description": "Whether to stream the download progress",
+                "default": False,
+            },
+        },
+        "required": ["name"],
+    }
 
     async def _execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the pull model command"""
@@ -457,48 +663,42 @@ class OllamaPullModel(OllamaBaseTool):
 class OllamaManageAgents(OllamaBaseTool):
     """Manage Ollama agents and endpoints for agentic responses"""
 
-    @property
-    def name(self) -> str:
-        return "ollama_manage_agents"
+    __slots__ = ()
 
-    @property
-    def description(self) -> str:
-        return "Manage Ollama agents, endpoints, and API keys for multi-agent agentic responses"
+    name = "ollama_manage_agents"
+    description = "Manage Ollama agents, endpoints, and API keys for multi-agent agentic responses"
 
-    @property
-    def input_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "action": {
-                    "type": "string",
-                    "enum": ["list", "add", "remove", "test", "configure"],
-                    "description": "Action to perform on agents",
-                },
-                "agent_name": {
-                    "type": "string",
-                    "description": "Name of the agent (e.g., 'secondary', 'analyst', 'reviewer')",
-                },
-                "api_url": {
-                    "type": "string",
-                    "description": "Ollama API endpoint URL for the agent",
-                },
-                "api_key": {
-                    "type": "string",
-                    "description": "API key for the endpoint (optional)",
-                },
-                "model": {
-                    "type": "string",
-                    "description": "Default model for this agent",
-                },
-                "role": {
-                    "type": "string",
-                    "description": "Role/purpose of this agent",
-                },
+    input_schema = {
+        "type": "object",
+        "properties": {
+            "action": {
+                "type": "string",
+                "enum": ["list", "add", "remove", "test", "configure"],
+                "description": "Action to perform on agents",
             },
-            "required": ["action"],
-            "additionalProperties": False,
-        }
+            "agent_name": {
+                "type": "string",
+                "description": "Name of the agent (e.g., 'secondary', 'analyst', 'reviewer')",
+            },
+            "api_url": {
+                "type": "string",
+                "description": "Ollama API endpoint URL for the agent",
+            },
+            "api_key": {
+                "type": "string",
+                "description": "API key for the endpoint (optional)",
+            },
+            "model": {
+                "type": "string",
+                "description": "Default model for this agent",
+            },
+            "role": {
+                "type": "string",
+                "description": "Role/purpose of this agent",
+            },
+        },
+        "required": ["action"],
+    }
 
     async def _execute(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """Execute the agent management command"""
@@ -575,8 +775,6 @@ class OllamaManageAgents(OllamaBaseTool):
 
         # This would typically update persistent configuration
         # For now, we'll just validate the configuration
-        from ..config.settings import OllamaAgentConfig
-
         try:
             agent_config = OllamaAgentConfig(
                 api_url=api_url,
@@ -742,10 +940,10 @@ services:
             async with aiohttp.ClientSession(
                 timeout=timeout, headers=headers
             ) as session:
-                url = f"{agent_config.api_url.rstrip('/')}/api/version"
+                url = f"{agent_config.api_url}/api/version"
                 async with session.get(url) as response:
                     if response.status == 200:
-                        version_data = await response.json()
+                        version_data = await response.json(loads=json_loads)
                         return {
                             "healthy": True,
                             "version": version_data.get("version", "unknown"),
@@ -5,12 +5,101 @@ This module provides tool registration, discovery, and management capabilities.
 """
 
 import asyncio
-from typing import Dict, List, Optional, Type, Any
+import importlib
+import inspect
+from functools import lru_cache, partial
+from importlib.metadata import entry_points
+from types import MappingProxyType
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
 import structlog
 
 from .base_tool import BaseTool, ToolSchema, ToolResult, ToolExecutionContext
 from ..config import get_config
 
+_discovery_logger = structlog.get_logger("auto_discover")
+
+# Entry point group for tools shipped by other packages. Each entry point is
+# named after a category and resolves to a tool class or a list of them.
+TOOL_ENTRY_POINT_GROUP = "ollama_mcp_server.tools"
+
+# Built-in tools as (module, category, label, class names). Modules are only
+# imported by auto_discover_tools when their category is requested.
+BUILTIN_TOOLS: Tuple[Tuple[str, str, str, Tuple[str, ...]], ...] = (
+    (
+        ".ollama",
+        "ollama",
+        "Ollama",
+        (
+            "OllamaListModels",
+            "OllamaChat",
+            "OllamaGenerate",
+            "OllamaPullModel",
+            "OllamaManageAgents",
+        ),
+    ),
+    (
+        ".infrastructure",
+        "infrastructure",
+        "infrastructure",
+        ("DockerListContainers", "DockerRunContainer", "KubernetesListPods"),
+    ),
+    (".git", "git", "Git", ("GitStatus", "GitClone", "GitCommit", "GitBranch")),
+    (
+        ".github",
+        "github",
+        "GitHub",
+        (
+            "GitHubGetFileContents",
+            "GitHubGetCommit",
+            "GitHubListCommits",
+            "GitHubListBranches",
+            "GitHubSearchRepositories",
+            "GitHubGetIssue",
+            "GitHubListPullRequests",
+        ),
+    ),
+    (
+        ".playwright",
+        "browser",
+        "Playwright",
+        (
+            "PlaywrightNavigate",
+            "PlaywrightTakeScreenshot",
+            "PlaywrightClick",
+            "PlaywrightType",
+            "PlaywrightWaitFor",
+            "PlaywrightGetText",
+            "PlaywrightFillForm",
+            "PlaywrightEvaluate",
+            "PlaywrightGetPageInfo",
+        ),
+    ),
+    (
+        ".mcp_gateway",
+        "mcp_gateway",
+        "MCP Gateway",
+        (
+            "MCPGatewayConnect",
+            "MCPGatewayDisconnect",
+            "MCPGatewayListServers",
+            "MCPGatewayListTools",
+            "MCPGatewayCallTool",
+            "MCPGatewayListResources",
+        ),
+    ),
+)
+
 
 class ToolRegistry:
     """
@@ -19,12 +108,21 @@ class ToolRegistry:
     Manages tool registration, discovery, validation, and execution routing.
     """
 
+    logger = structlog.get_logger("ToolRegistry")
+
     def __init__(self):
         self.config = get_config()
-        self.logger = structlog.get_logger("ToolRegistry")
         self._tools: Dict[str, BaseTool] = {}
         self._tool_classes: Dict[str, Type[BaseTool]] = {}
-        self._categories: Dict[str, List[str]] = {}
+        # Categories map to insertion-ordered sets (dicts with None values)
+        self._categories: Dict[str, Dict[str, None]] = {}
+        self._tool_to_category: Dict[str, str] = {}
+        self._category_counts: Dict[str, int] = {}
+        self._schemas: Dict[str, ToolSchema] = {}
+        self._health_probes: Dict[str, Callable[[], Awaitable[bool]]] = {}
+        self._schema_cache: Dict[Optional[str], Tuple[ToolSchema, ...]] = {}
+        # Bumped on every register/unregister so callers can cache derived views
+        self.version = 0
 
     def register_tool(
         self, tool_class: Type[BaseTool], category: str = "general"
@@ -49,12 +147,28 @@ class ToolRegistry:
 
         self._tools[tool_name] = tool_instance
         self._tool_classes[tool_name] = tool_class
+        self._schemas[tool_name] = tool_instance.schema
+
+        # Synchronous health checks run on a worker thread so a blocking probe
+        # cannot stall the event loop
+        if inspect.iscoroutinefunction(tool_instance.health_check):
+            self._health_probes[tool_name] = tool_instance.health_check
+        else:
+            self._health_probes[tool_name] = partial(
+                asyncio.to_thread, tool_instance.health_check
+            )
 
-        # Add to category
-        if category not in self._categories:
-            self._categories[category] = []
-        if tool_name not in self._categories[category]:
-            self._categories[category].append(tool_name)
+        # Add to category, moving the tool if it was registered elsewhere
+        previous = self._tool_to_category.get(tool_name)
+        if previous != category:
+            if previous is not None:
+                self._categories[previous].pop(tool_name, None)
+                self._category_counts[previous] -= 1
+            self._categories.setdefault(category, {})[tool_name] = None
+            self._category_counts[category] = self._category_counts.get(category, 0) + 1
+            self._tool_to_category[tool_name] = category
+        self._schema_cache.clear()
+        self.version += 1
 
         self.logger.info(
             "Tool registered successfully",
@@ -79,11 +193,16 @@ class ToolRegistry:
         # Remove from tools
         del self._tools[tool_name]
         del self._tool_classes[tool_name]
+        del self._schemas[tool_name]
+        del self._health_probes[tool_name]
 
-        # Remove from categories
-        for category, tools in self._categories.items():
-            if tool_name in tools:
-                tools.remove(tool_name)
+        # Remove from its category
+        category = self._tool_to_category.pop(tool_name, None)
+        if category is not None:
+            self._categories[category].pop(tool_name, None)
+            self._category_counts[category] -= 1
+        self._schema_cache.clear()
+        self.version += 1
 
         self.logger.info("Tool unregistered", tool_name=tool_name)
         return True
@@ -100,23 +219,44 @@ class ToolRegistry:
         """
         return self._tools.get(tool_name)
 
-    def list_tools(self, category: Optional[str] = None) -> List[ToolSchema]:
+    def iter_tools(self) -> Iterator[BaseTool]:
+        """
+        Iterate over the registered tool instances
+
+        Returns:
+            Iterator over a snapshot of the tool instances
+        """
+        return iter(tuple(self._tools.values()))
+
+    def list_tools(self, category: Optional[str] = None) -> Tuple[ToolSchema, ...]:
         """
         List all registered tools or tools in a specific category
 
+        The result is cached until the next register or unregister call.
+
         Args:
             category: Optional category filter
 
         Returns:
-            List of tool schemas
+            Tuple of tool schemas
         """
+        category = category or None
+        schemas = self._schema_cache.get(category)
+        if schemas is not None:
+            return schemas
+
         if category:
-            tool_names = self._categories.get(category, [])
-            tools = [self._tools[name] for name in tool_names if name in self._tools]
+            all_schemas = self._schemas
+            schemas = tuple(
+                all_schemas[name]
+                for name in self._categories.get(category, ())
+                if name in all_schemas
+            )
         else:
-            tools = list(self._tools.values())
+            schemas = tuple(self._schemas.values())
 
-        return [tool.schema for tool in tools]
+        self._schema_cache[category] = schemas
+        return schemas
 
     def list_categories(self) -> List[str]:
         """
@@ -125,9 +265,9 @@ class ToolRegistry:
         Returns:
             List of category names
         """
-        return list(self._categories.keys())
+        return list(self._categories)
 
-    def get_tools_by_category(self, category: str) -> List[str]:
+    def get_tools_by_category(self, category: str) -> Tuple[str, ...]:
         """
         Get tool names in a specific category
 
@@ -135,9 +275,9 @@ class ToolRegistry:
             category: Category name
 
         Returns:
-            List of tool names
+            Immutable tuple of tool names
         """
-        return self._categories.get(category, []).copy()
+        return tuple(self._categories.get(category, ()))
 
     def is_tool_registered(self, tool_name: str) -> bool:
         """
@@ -186,45 +326,47 @@ class ToolRegistry:
         """
         self.logger.info("Starting health check for all tools")
 
-        health_results = {}
+        tools_config = self.config.tools
+        timeout = tools_config.health_check_timeout
+        semaphore = asyncio.Semaphore(tools_config.max_concurrent_health_checks)
 
-        # Run health checks concurrently for better performance
-        async def check_tool(tool_name: str, tool: BaseTool) -> tuple[str, bool]:
+        # Each check is bounded by its own timeout and never raises, so a
+        # stalled or failing tool cannot cancel its siblings in the group
+        async def check_tool(tool_name: str) -> bool:
             try:
-                result = await tool.health_check()
-                return tool_name, result
+                async with semaphore:
+                    return await asyncio.wait_for(
+                        self._health_probes[tool_name](), timeout=timeout
+                    )
+            except asyncio.TimeoutError:
+                self.logger.error(
+                    "Health check timed out",
+                    tool_name=tool_name,
+                    timeout=timeout,
+                )
+                return False
             except Exception as e:
                 self.logger.error(
                     "Health check exception",
                     tool_name=tool_name,
                     error=str(e),
                 )
-                return tool_name, False
+                return False
 
-        # Create tasks for all tools
-        tasks = [check_tool(tool_name, tool) for tool_name, tool in self._tools.items()]
+        # Tools without a real probe report their static availability
+        health_results = {
+            tool_name: tool.available for tool_name, tool in self._tools.items()
+        }
 
-        # Execute health checks with a reasonable timeout
-        try:
-            results = await asyncio.wait_for(
-                asyncio.gather(*tasks, return_exceptions=True),
-                timeout=30.0,  # 30 second timeout for all health checks
-            )
+        async with asyncio.TaskGroup() as group:
+            tasks = {
+                tool_name: group.create_task(check_tool(tool_name))
+                for tool_name, tool in self._tools.items()
+                if tool.requires_health_check
+            }
 
-            for result in results:
-                if isinstance(result, tuple):
-                    tool_name, health_status = result
-                    health_results[tool_name] = health_status
-                else:
-                    # Exception occurred
-                    self.logger.error("Health check task failed", error=str(result))
-
-        except asyncio.TimeoutError:
-            self.logger.error("Health check timed out")
-            # Mark remaining tools as unhealthy
-            for tool_name in self._tools:
-                if tool_name not in health_results:
-                    health_results[tool_name] = False
+        for tool_name, task in tasks.items():
+            health_results[tool_name] = task.result()
 
         # Log summary
         healthy_count = sum(1 for status in health_results.values() if status)
@@ -248,6 +390,28 @@ class ToolRegistry:
 
         self.logger.info("Cleared caches for all tools")
 
+    def get_stats_summary(self) -> Dict[str, Any]:
+        """
+        Get tool counts without materializing the tool names
+
+        Returns:
+            Dictionary with the total tool count and a read-only view of the
+            per-category counts
+        """
+        return {
+            "total_tools": len(self._tools),
+            "categories": MappingProxyType(self._category_counts),
+        }
+
+    def get_tool_names(self) -> Tuple[str, ...]:
+        """
+        Get the names of all registered tools
+
+        Returns:
+            Tuple of tool names
+        """
+        return tuple(self._tools)
+
     def get_tool_statistics(self) -> Dict[str, Any]:
         """
         Get statistics about registered tools
@@ -255,15 +419,10 @@ class ToolRegistry:
         Returns:
             Dictionary with tool statistics
         """
-        total_tools = len(self._tools)
-        categories_stats = {
-            category: len(tools) for category, tools in self._categories.items()
-        }
-
         return {
-            "total_tools": total_tools,
-            "categories": categories_stats,
-            "tool_names": list(self._tools.keys()),
+            "total_tools": len(self._tools),
+            "categories": dict(self._category_counts),
+            "tool_names": self.get_tool_names(),
         }
 
     def validate_tool_exists(self, tool_name: str) -> None:
@@ -277,167 +436,77 @@ class ToolRegistry:
             ValueError: If tool doesn't exist
         """
         if not self.is_tool_registered(tool_name):
-            available_tools = list(self._tools.keys())
             raise ValueError(
                 f"Tool '{tool_name}' not found. "
-                f"Available tools: {', '.join(available_tools)}"
+                f"Available tools: {', '.join(self._tools)}"
             )
 
 
-# Global tool registry instance
-_registry: Optional[ToolRegistry] = None
-
-
+@lru_cache(maxsize=1)
 def get_tool_registry() -> ToolRegistry:
     """Get the global tool registry instance"""
-    global _registry
-    if _registry is None:
-        _registry = ToolRegistry()
-    return _registry
+    return ToolRegistry()
 
 
 def register_tool(tool_class: Type[BaseTool], category: str = "general") -> None:
     """Convenience function to register a tool"""
-    registry = get_tool_registry()
-    registry.register_tool(tool_class, category)
+    get_tool_registry().register_tool(tool_class, category)
 
 
-def auto_discover_tools() -> None:
+def auto_discover_tools(categories: Optional[Iterable[str]] = None) -> None:
     """
     Auto-discover and register all available tools
 
     This function will be called during server startup to automatically
-    register all available tool implementations.
+    register all available tool implementations. Built-in tool modules are
+    only imported for the requested categories, and third-party tools are
+    picked up from the ``ollama_mcp_server.tools`` entry point group.
+
+    Args:
+        categories: Optional categories to discover; all when omitted
     """
     registry = get_tool_registry()
-    logger = structlog.get_logger("auto_discover")
+    register = registry.register_tool
+    logger = _discovery_logger
+    wanted = None if categories is None else frozenset(categories)
 
     logger.info("Starting auto-discovery of tools")
 
-    # Import and register tool modules
-    # This will be expanded as we add more tool categories
-
-    try:
-        # Ollama tools
-        from .ollama import (
-            OllamaListModels,
-            OllamaChat,
-            OllamaGenerate,
-            OllamaPullModel,
-            OllamaManageAgents,
-        )
-
-        registry.register_tool(OllamaListModels, "ollama")
-        registry.register_tool(OllamaChat, "ollama")
-        registry.register_tool(OllamaGenerate, "ollama")
-        registry.register_tool(OllamaPullModel, "ollama")
-        registry.register_tool(OllamaManageAgents, "ollama")
-
-    except ImportError as e:
-        logger.warning("Could not import Ollama tools", error=str(e))
-
-    try:
-        # Infrastructure tools
-        from .infrastructure import (
-            DockerListContainers,
-            DockerRunContainer,
-            KubernetesListPods,
-        )
+    for module_name, category, label, class_names in BUILTIN_TOOLS:
+        if wanted is not None and category not in wanted:
+            continue
 
-        registry.register_tool(DockerListContainers, "infrastructure")
-        registry.register_tool(DockerRunContainer, "infrastructure")
-        registry.register_tool(KubernetesListPods, "infrastructure")
-
-    except ImportError as e:
-        logger.warning("Could not import infrastructure tools", error=str(e))
-
-    try:
-        # Git tools
-        from .git import GitStatus, GitClone, GitCommit, GitBranch
-
-        registry.register_tool(GitStatus, "git")
-        registry.register_tool(GitClone, "git")
-        registry.register_tool(GitCommit, "git")
-        registry.register_tool(GitBranch, "git")
-
-    except ImportError as e:
-        logger.warning("Could not import Git tools", error=str(e))
-
-    try:
-        # GitHub tools
-        from .github import (
-            GitHubGetFileContents,
-            GitHubGetCommit,
-            GitHubListCommits,
-            GitHubListBranches,
-            GitHubSearchRepositories,
-            GitHubGetIssue,
-            GitHubListPullRequests,
-        )
+        try:
+            module = importlib.import_module(module_name, __package__)
+        except ImportError as e:
+            logger.warning(f"Could not import {label} tools", error=str(e))
+            continue
 
-        registry.register_tool(GitHubGetFileContents, "github")
-        registry.register_tool(GitHubGetCommit, "github")
-        registry.register_tool(GitHubListCommits, "github")
-        registry.register_tool(GitHubListBranches, "github")
-        registry.register_tool(GitHubSearchRepositories, "github")
-        registry.register_tool(GitHubGetIssue, "github")
-        registry.register_tool(GitHubListPullRequests, "github")
-
-    except ImportError as e:
-        logger.warning("Could not import GitHub tools", error=str(e))
-
-    try:
-        # Playwright browser automation tools
-        from .playwright import (
-            PlaywrightNavigate,
-            PlaywrightTakeScreenshot,
-            PlaywrightClick,
-            PlaywrightType,
-            PlaywrightWaitFor,
-            PlaywrightGetText,
-            PlaywrightFillForm,
-            PlaywrightEvaluate,
-            PlaywrightGetPageInfo,
-        )
+        for class_name in class_names:
+            register(getattr(module, class_name), category)
 
-        registry.register_tool(PlaywrightNavigate, "browser")
-        registry.register_tool(PlaywrightTakeScreenshot, "browser")
-        registry.register_tool(PlaywrightClick, "browser")
-        registry.register_tool(PlaywrightType, "browser")
-        registry.register_tool(PlaywrightWaitFor, "browser")
-        registry.register_tool(PlaywrightGetText, "browser")
-        registry.register_tool(PlaywrightFillForm, "browser")
-        registry.register_tool(PlaywrightEvaluate, "browser")
-        registry.register_tool(PlaywrightGetPageInfo, "browser")
-
-    except ImportError as e:
-        logger.warning("Could not import Playwright tools", error=str(e))
-
-    try:
-        # MCP Gateway tools
-        from .mcp_gateway import (
-            MCPGatewayConnect,
-            MCPGatewayDisconnect,
-            MCPGatewayListServers,
-            MCPGatewayListTools,
-            MCPGatewayCallTool,
-            MCPGatewayListResources,
-        )
+    for entry_point in entry_points(group=TOOL_ENTRY_POINT_GROUP):
+        if wanted is not None and entry_point.name not in wanted:
+            continue
 
-        registry.register_tool(MCPGatewayConnect, "mcp_gateway")
-        registry.register_tool(MCPGatewayDisconnect, "mcp_gateway")
-        registry.register_tool(MCPGatewayListServers, "mcp_gateway")
-        registry.register_tool(MCPGatewayListTools, "mcp_gateway")
-        registry.register_tool(MCPGatewayCallTool, "mcp_gateway")
-        registry.register_tool(MCPGatewayListResources, "mcp_gateway")
+        try:
+            loaded = entry_point.load()
+        except ImportError as e:
+            logger.warning(
+                "Could not import plugin tools",
+                entry_point=entry_point.value,
+                error=str(e),
+            )
+            continue
 
-    except ImportError as e:
-        logger.warning("Could not import MCP Gateway tools", error=str(e))
+        tool_classes = loaded if isinstance(loaded, (list, tuple)) else (loaded,)
+        for tool_class in tool_classes:
+            register(tool_class, entry_point.name)
 
     # Log final statistics
-    stats = registry.get_tool_statistics()
+    stats = registry.get_stats_summary()
     logger.info(
         "Tool auto-discovery completed",
         total_tools=stats["total_tools"],
-        categories=list(stats["categories"].keys()),
+        categories=list(stats["categories"]),
     )
@@ -9,6 +9,13 @@ from .logging import (
     AuditLogger,
     PerformanceLogger,
 )
+from .serialization import (
+    json_dumps,
+    json_dumps_pretty,
+    json_dumps_sorted,
+    json_loads,
+    ORJSON_AVAILABLE,
+)
 
 __all__ = [
     "setup_logging",
@@ -18,4 +25,9 @@ __all__ = [
     "performance_logger",
     "AuditLogger",
     "PerformanceLogger",
+    "json_dumps",
+    "json_dumps_pretty",
+    "json_dumps_sorted",
+    "json_loads",
+    "ORJSON_AVAILABLE",
 ]
@@ -5,8 +5,12 @@ This module provides structured logging using structlog with rich formatting
 for development and JSON formatting for production.
 """
 
+import atexit
+import functools
 import sys
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Dict, Optional
 import structlog
 from rich.console import Console
@@ -14,9 +18,35 @@ from rich.logging import RichHandler
 
 from ..config import get_config
 
+# Set once logging has been configured, making repeat setup calls no-ops
+_configured = False
+
+# Background thread writing the records queued by the root logger's handler
+_listener: Optional[QueueListener] = None
+
+
+def _stop_log_listener() -> None:
+    """Flush queued log records and stop the background writer"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_log_listener)
+
+
+def setup_logging(force: bool = False) -> None:
+    """
+    Configure structured logging for the application
+
+    Args:
+        force: Reconfigure even if logging was already set up
+    """
+    global _configured
+    if _configured and not force:
+        return
 
-def setup_logging() -> None:
-    """Configure structured logging for the application"""
     config = get_config()
 
     # Configure standard library logging
@@ -26,7 +56,8 @@ def setup_logging() -> None:
         level=getattr(logging, config.log_level),
     )
 
-    # Configure processors based on environment
+    # Processors run by structlog. Rendering, including traceback formatting,
+    # is done by the root handler's formatter, still on the calling thread
     processors = [
         structlog.stdlib.filter_by_level,
         structlog.stdlib.add_logger_name,
@@ -34,12 +65,17 @@ def setup_logging() -> None:
         structlog.stdlib.PositionalArgumentsFormatter(),
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.processors.StackInfoRenderer(),
+        structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+    ]
+
+    render_processors = [
+        structlog.stdlib.ProcessorFormatter.remove_processors_meta,
         structlog.processors.format_exc_info,
     ]
 
     if config.is_development():
         # Rich formatting for development
-        processors.extend(
+        render_processors.extend(
             [
                 structlog.processors.UnicodeDecoder(),
                 structlog.dev.ConsoleRenderer(colors=True),
@@ -58,7 +94,7 @@ def setup_logging() -> None:
 
     else:
         # JSON formatting for production
-        processors.extend(
+        render_processors.extend(
             [
                 structlog.processors.dict_tracebacks,
                 structlog.processors.JSONRenderer(),
@@ -67,6 +103,15 @@ def setup_logging() -> None:
 
         handler = logging.StreamHandler()
 
+    formatter = structlog.stdlib.ProcessorFormatter(
+        processors=render_processors,
+        foreign_pre_chain=[
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+        ],
+    )
+
     # Configure structlog
     structlog.configure(
         processors=processors,
@@ -75,14 +120,37 @@ def setup_logging() -> None:
         cache_logger_on_first_use=True,
     )
 
+    global _listener
+    _stop_log_listener()
+
     # Set up the root logger
     root_logger = logging.getLogger()
     root_logger.handlers.clear()
-    root_logger.addHandler(handler)
+
+    if config.is_development():
+        # Rich lays out each record for the terminal as it is emitted, so the
+        # handler runs inline and its output stays in order with other writes
+        handler.setFormatter(formatter)
+        root_logger.addHandler(handler)
+    else:
+        # Records are rendered on the calling thread, so they capture the
+        # event as it was logged, and only the finished message is handed to
+        # a background thread for the stream write. The queue is unbounded,
+        # so audit records are never dropped.
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        _listener.start()
+
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(formatter)
+        root_logger.addHandler(queue_handler)
+
+    _configured = True
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(name: Optional[str] = None) -> structlog.BoundLogger:
-    """Get a structured logger instance"""
+    """Get a structured logger instance, shared per name"""
     return structlog.get_logger(name)
 
 
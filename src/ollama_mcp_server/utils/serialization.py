@@ -0,0 +1,50 @@
+"""
+JSON serialization helpers for MCP DevOps Server
+
+This module provides fast JSON encoding and decoding using orjson when it is
+installed, falling back to the standard library json module otherwise.
+"""
+
+import functools
+import json
+from typing import Any
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+if ORJSON_AVAILABLE:
+
+    def json_dumps(obj: Any) -> str:
+        """Serialize an object to a compact JSON string"""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def json_dumps_sorted(obj: Any) -> bytes:
+        """Serialize an object to compact JSON bytes with sorted keys"""
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+
+    def json_dumps_pretty(obj: Any) -> str:
+        """Serialize an object to a JSON string indented by two spaces"""
+        return orjson.dumps(
+            obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+
+    json_loads = orjson.loads
+
+else:
+    json_dumps = functools.partial(
+        json.dumps, separators=(",", ":"), ensure_ascii=False
+    )
+    json_loads = json.loads
+
+    def json_dumps_sorted(obj: Any) -> bytes:
+        """Serialize an object to compact JSON bytes with sorted keys"""
+        return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode()
+
+    def json_dumps_pretty(obj: Any) -> str:
+        """Serialize an object to a JSON string indented by two spaces"""
+        return json.dumps(obj, indent=2, ensure_ascii=False)
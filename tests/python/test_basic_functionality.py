@@ -5,12 +5,18 @@ These tests validate the core functionality and ensure the migration
 from Node.js is working correctly.
 """
 
+import shutil
+import subprocess
+
 import pytest
+from pydantic import BaseModel
 
 from ollama_mcp_server.config import DevOpsConfig
 from ollama_mcp_server.tools.registry import ToolRegistry
 from ollama_mcp_server.tools.base_tool import BaseTool
 from ollama_mcp_server.tools.ollama import OllamaListModels, OllamaChat
+from ollama_mcp_server.tools import git as git_tools
+from ollama_mcp_server.tools.git import GitClone, GitStatus, _clone_dir_name
 from ollama_mcp_server.server.mcp_server import MCPDevOpsServer
 
 
@@ -56,6 +62,67 @@ class TestDevOpsConfig:
         assert config.is_production() is False
         assert config.is_development() is True
 
+    def test_sub_config_env_names_case_insensitive(self, monkeypatch):
+        """Test mixed-case env variables reach cached sub-configurations"""
+        assert DevOpsConfig().tools.enable_caching is True
+
+        monkeypatch.setenv("Tool_Enable_Caching", "false")
+        assert DevOpsConfig().tools.enable_caching is False
+
+    def test_from_yaml_returns_independent_copies(self, tmp_path):
+        """Test cached YAML loads are isolated from caller overrides"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("server_name: yaml-server\n")
+
+        first = DevOpsConfig.from_yaml(config_file)
+        first.debug = True
+
+        second = DevOpsConfig.from_yaml(config_file)
+        assert second.server_name == "yaml-server"
+        assert second.debug is False
+
+    def test_from_yaml_caches_parsed_data_outside_config_dir(
+        self, tmp_path, monkeypatch
+    ):
+        """Test the parsed YAML cache goes to the user cache directory"""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        config_file = config_dir / "config.yaml"
+        config_file.write_text("server_name: yaml-server\n")
+
+        DevOpsConfig.from_yaml(config_file)
+
+        assert list(config_dir.iterdir()) == [config_file]
+        assert list((tmp_path / "cache").rglob("*.json"))
+
+    def test_from_yaml_sees_environment_changes(self, tmp_path, monkeypatch):
+        """Test cached YAML loads are not reused across environments"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("server_name: yaml-server\n")
+
+        assert DevOpsConfig.from_yaml(config_file).debug is False
+
+        monkeypatch.setenv("MCP_DEVOPS_DEBUG", "true")
+        assert DevOpsConfig.from_yaml(config_file).debug is True
+
+    def test_from_yaml_reads_agent_settings(self, tmp_path, monkeypatch):
+        """Test agent_<N>_* keys in the YAML ollama section configure agents"""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text(
+            "ollama:\n"
+            "  agent_2_url: http://other:11434/\n"
+            "  agent_2_role: analyst\n"
+        )
+
+        config = DevOpsConfig.from_yaml(config_file)
+
+        assert sorted(config.ollama.get_available_agents()) == ["agent_2", "primary"]
+        agent = config.ollama.get_agent_by_role("analyst")
+        assert agent.api_url == "http://other:11434"
+        assert agent.model == "llama2"
+
 
 class MockTool(BaseTool):
     """Mock tool for testing"""
@@ -183,6 +250,38 @@ class TestBaseTool:
         assert result.error is not None
         assert "must be a dictionary" in result.error
 
+    @pytest.mark.asyncio
+    async def test_tool_property_schema_validation(self):
+        """Test schemas declared as properties are enforced too"""
+        tool = MockTool()
+
+        result = await tool.execute({"test_param": 1})
+
+        assert result.success is False
+        assert "Invalid arguments" in result.error
+
+    @pytest.mark.asyncio
+    async def test_tool_input_model_validation(self):
+        """Test argument validation through a pydantic input model"""
+
+        class MockArguments(BaseModel):
+            test_param: str
+            count: int = 1
+
+        class ModelMockTool(MockTool):
+            input_model = MockArguments
+
+        tool = ModelMockTool()
+
+        assert tool.validate_arguments({"test_param": "x"}) == {
+            "test_param": "x",
+            "count": 1,
+        }
+
+        result = await tool.execute({"count": "many"})
+        assert result.success is False
+        assert "Invalid arguments" in result.error
+
     @pytest.mark.asyncio
     async def test_tool_caching(self):
         """Test tool result caching"""
@@ -200,6 +299,18 @@ class TestBaseTool:
         assert result2.success is True
         assert result2.metadata.get("cached") is True
 
+    @pytest.mark.asyncio
+    async def test_tool_caching_disabled_after_construction(self, monkeypatch):
+        """Test that disabling caching takes effect on existing tools"""
+        tool = MockTool()
+        monkeypatch.setattr(tool.config.tools, "enable_caching", True)
+        await tool.execute({"test_param": "toggled"})
+
+        monkeypatch.setattr(tool.config.tools, "enable_caching", False)
+        result = await tool.execute({"test_param": "toggled"})
+        assert result.success is True
+        assert not (result.metadata or {}).get("cached")
+
     def test_cache_key_generation(self):
         """Test cache key generation"""
         tool = MockTool()
@@ -245,6 +356,77 @@ class TestOllamaTools:
         assert schema["properties"]["model"]["type"] == "string"
         assert schema["properties"]["messages"]["type"] == "array"
 
+    @pytest.mark.asyncio
+    async def test_ollama_chat_schema_validation(self):
+        """Test arguments are validated against the compiled input schema"""
+        tool = OllamaChat()
+
+        result = await tool.execute({"model": "llama2", "messages": []})
+
+        assert result.success is False
+        assert "Invalid arguments" in result.error
+
+    @pytest.mark.asyncio
+    async def test_ollama_chat_stream_aggregation(self, monkeypatch):
+        """Test streamed chat chunks are merged into a single response"""
+        tool = OllamaChat()
+
+        async def fake_stream(
+            self, endpoint, method="POST", data=None, agent_name=None
+        ):
+            for content in ("Hel", "lo", ""):
+                yield {
+                    "model": "llama2",
+                    "message": {"role": "assistant", "content": content},
+                    "done": content == "",
+                }
+
+        monkeypatch.setattr(OllamaChat, "stream_ollama_request", fake_stream)
+
+        result = await tool._execute(
+            {
+                "model": "llama2",
+                "messages": [{"role": "user", "content": "Hi"}],
+                "stream": True,
+            }
+        )
+
+        assert result["message"] == {"role": "assistant", "content": "Hello"}
+        assert result["done"] is True
+
+    @pytest.mark.asyncio
+    async def test_ollama_stream_lines_split_across_chunks(self, monkeypatch):
+        """Test streamed NDJSON lines are rebuilt across network chunks"""
+        tool = OllamaChat()
+        chunks = [b'{"a":', b"1", b'}\n{"a"', b':2}\n{"a":3}']
+
+        class FakeContent:
+            async def iter_any(self):
+                for chunk in chunks:
+                    yield chunk
+
+        class FakeResponse:
+            status = 200
+            content = FakeContent()
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc_info):
+                return False
+
+        class FakeSession:
+            def request(self, method, url, **kwargs):
+                return FakeResponse()
+
+        monkeypatch.setattr(
+            OllamaChat, "_get_agent_session", lambda self, config: FakeSession()
+        )
+
+        received = [chunk async for chunk in tool.stream_ollama_request("/api/chat")]
+
+        assert received == [{"a": 1}, {"a": 2}, {"a": 3}]
+
     @pytest.mark.asyncio
     async def test_ollama_health_check_no_server(self):
         """Test Ollama health check when server is not available"""
@@ -255,6 +437,106 @@ class TestOllamaTools:
         assert health is False
 
 
+def run_git(cwd, *args):
+    """Run a git command for test setup, failing the test if it fails"""
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+class TestGitTools:
+    """Test Git tool implementations"""
+
+    @pytest.mark.parametrize(
+        "url, expected",
+        [
+            ("https://github.com/owner/repo.git", "repo"),
+            ("git@github.com:owner/repo.git", "repo"),
+            ("/srv/repo/.git", "repo"),
+            ("/srv/repo/", "repo"),
+            ("https://user@host:8080", "host"),
+            ("foo:bar.git", "bar"),
+        ],
+    )
+    def test_clone_dir_name(self, url, expected):
+        """Test default clone directories follow git's own naming"""
+        assert _clone_dir_name(url) == expected
+
+    @pytest.mark.asyncio
+    async def test_git_clone_default_destination(self, tmp_path, monkeypatch):
+        """Test cloning a path ending in /.git lands in the repository name"""
+        source = tmp_path / "repo"
+        source.mkdir()
+        run_git(source, "init", "-q")
+        run_git(source, "commit", "-q", "--allow-empty", "-m", "initial")
+        workdir = tmp_path / "work"
+        workdir.mkdir()
+        monkeypatch.chdir(workdir)
+
+        result = await GitClone().execute({"url": str(source / ".git")})
+
+        assert result.success is True, result.error
+        assert (workdir / "repo" / ".git").is_dir()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "state", ["clean", "staged", "unstaged", "untracked", "conflicted"]
+    )
+    async def test_git_status_backends_agree(self, tmp_path, monkeypatch, state):
+        """Test the pygit2 and porcelain status paths report the same result"""
+        if not (git_tools.GIT_AVAILABLE and git_tools.PYGIT2_AVAILABLE):
+            pytest.skip("GitPython and pygit2 are both required")
+
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        run_git(repo, "init", "-q", "-b", "main")
+        (repo / "f").write_text("base\n")
+        (repo / "g").write_text("other\n")
+        run_git(repo, "add", "f", "g")
+        run_git(repo, "commit", "-q", "-m", "initial")
+
+        if state == "staged":
+            (repo / "f").write_text("staged\n")
+            (repo / "new").write_text("new\n")
+            run_git(repo, "add", "f", "new")
+            run_git(repo, "rm", "-q", "g")
+        elif state == "unstaged":
+            (repo / "f").write_text("unstaged\n")
+            (repo / "g").unlink()
+        elif state == "untracked":
+            (repo / "untracked").write_text("untracked\n")
+        elif state == "conflicted":
+            run_git(repo, "checkout", "-q", "-b", "side")
+            (repo / "f").write_text("side\n")
+            run_git(repo, "commit", "-q", "-am", "side")
+            run_git(repo, "checkout", "-q", "main")
+            (repo / "f").write_text("main\n")
+            run_git(repo, "commit", "-q", "-am", "main")
+            with pytest.raises(subprocess.CalledProcessError):
+                run_git(repo, "merge", "side")
+
+        async def status(use_pygit2):
+            monkeypatch.setattr(git_tools, "PYGIT2_AVAILABLE", use_pygit2)
+            result = await GitStatus()._execute({"repository_path": str(repo)})
+            for key in ("staged_files", "unstaged_files", "untracked_files"):
+                result[key] = sorted(result[key], key=str)
+            return result
+
+        pygit2_result = await status(True)
+        porcelain_result = await status(False)
+
+        assert pygit2_result == porcelain_result
+        assert pygit2_result["is_dirty"] is (state not in ("clean", "untracked"))
+        if state == "conflicted":
+            assert pygit2_result["unstaged_files"] == [
+                {"path": "f", "change_type": "U"}
+            ]
+
+
 class TestMCPDevOpsServer:
     """Test MCP DevOps Server"""
 